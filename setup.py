@@ -29,6 +29,10 @@ setup(
         "rich>=13.0.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9",
+            "msgpack>=1.0",
+        ],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
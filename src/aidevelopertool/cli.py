@@ -1,15 +1,9 @@
 """Command-line interface for AIDeveloperTool."""
 import argparse
+import re
 import sys
 from pathlib import Path
-from typing import Optional
-
-try:
-    from rich.console import Console
-    from rich.table import Table
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+from typing import List, Optional
 
 from .core.project import AIProject
 from .setup.environment import EnvironmentChecker
@@ -18,38 +12,47 @@ from .feedback.tracker import FeedbackTracker, FeedbackLevel
 from .pipeline.manager import PipelineManager
 
 
-console = Console() if RICH_AVAILABLE else None
+# Rich console, created on first output (False if rich is not installed)
+_console = None
+
+_CSV_RE = re.compile(r"\s*,\s*")
 
 
 def print_output(message: str, style: str = "") -> None:
     """Print output with optional styling."""
-    if console:
-        console.print(message, style=style)
+    global _console
+    if _console is None:
+        try:
+            from rich.console import Console
+            _console = Console()
+        except ImportError:
+            _console = False
+    
+    if _console:
+        _console.print(message, style=style)
     else:
         print(message)
 
 
+def _csv(value: Optional[str]) -> List[str]:
+    """Split a comma-separated argument, stripping whitespace around items."""
+    return _CSV_RE.split(value.strip()) if value else []
+
+
 def cmd_init(args) -> int:
     """Initialize a new AI project."""
     print_output(f"Initializing project: {args.name}", style="bold green")
     
-    project = AIProject(args.name, Path.cwd())
-    
-    # Add default components
+    # Default components
     env_checker = EnvironmentChecker(config={
         "python_version": "3.8",
         "directories": ["data", "models", "notebooks"],
     })
-    project.add_component(env_checker)
-    
-    context_mgr = ContextManager()
-    project.add_component(context_mgr)
-    
-    feedback = FeedbackTracker()
-    project.add_component(feedback)
-    
-    pipeline_mgr = PipelineManager()
-    project.add_component(pipeline_mgr)
+    project = AIProject(
+        args.name,
+        Path.cwd(),
+        components=[env_checker, ContextManager(), FeedbackTracker(), PipelineManager()],
+    )
     
     # Initialize project
     if project.initialize():
@@ -71,9 +74,9 @@ def cmd_check(args) -> int:
     
     config = {
         "python_version": args.python_version or "3.8",
-        "required_packages": args.packages.split(",") if args.packages else [],
-        "required_tools": args.tools.split(",") if args.tools else [],
-        "directories": args.directories.split(",") if args.directories else [],
+        "required_packages": _csv(args.packages),
+        "required_tools": _csv(args.tools),
+        "directories": _csv(args.directories),
     }
     
     checker = EnvironmentChecker(config=config)
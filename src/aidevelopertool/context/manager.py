@@ -1,11 +1,21 @@
 """Context manager for sharing state between tasks."""
-import json
-from typing import Dict, Any, Optional, List
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Optional, List, Set, TextIO
 from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
 
 from ..core.component import Component
+from ..core import serialization
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 
 class ContextManager(Component):
@@ -15,6 +25,20 @@ class ContextManager(Component):
     AI development workflow, reducing duplication and improving collaboration.
     """
 
+    __slots__ = (
+        "contexts",
+        "context_history",
+        "storage_dir",
+        "auto_save",
+        "storage_format",
+        "flush_interval",
+        "snapshot_interval",
+        "_dirty",
+        "_last_flush",
+        "_log_fh",
+        "_lock",
+    )
+
     def __init__(self, name: str = "context", config: Optional[Dict[str, Any]] = None):
         """Initialize context manager.
         
@@ -23,12 +47,29 @@ class ContextManager(Component):
             config: Configuration dictionary with:
                 - storage_dir: Directory to store context files
                 - auto_save: Whether to auto-save context changes
+                - history_max: Maximum number of history entries kept in memory
+                - storage_format: Snapshot format, "json" or "msgpack"
+                  (msgpack requires the msgpack package)
+                - flush_interval: Minimum seconds between auto-save flushes
+                - snapshot_interval: Updates between full snapshots; updates in
+                  between are appended to a per-context change log
         """
         super().__init__(name, config)
         self.contexts: Dict[str, Dict[str, Any]] = {}
-        self.context_history: List[Dict[str, Any]] = []
+        self.context_history: Deque[Dict[str, Any]] = deque(
+            maxlen=self.config.get("history_max", 1024)
+        )
         self.storage_dir = Path(self.config.get("storage_dir", ".ai_context"))
         self.auto_save = self.config.get("auto_save", True)
+        self.storage_format = self.config.get("storage_format", "json")
+        self.flush_interval = self.config.get("flush_interval", 0.1)
+        self.snapshot_interval = self.config.get("snapshot_interval", 32)
+        self._dirty: Set[str] = set()
+        self._last_flush = float("-inf")
+        self._log_fh: Dict[str, TextIO] = {}
+        # Guards context changes, the dirty set and the files it schedules;
+        # pipeline tasks may update contexts from several threads
+        self._lock = threading.RLock()
 
     def initialize(self) -> bool:
         """Initialize the context manager."""
@@ -50,16 +91,28 @@ class ContextManager(Component):
             context_id: Unique identifier for the context
             data: Initial context data
         """
-        self.contexts[context_id] = {
-            "id": context_id,
-            "data": data or {},
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
-            "version": 1,
-        }
-        
-        if self.auto_save:
-            self.save_context(context_id)
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.contexts[context_id] = {
+                "id": context_id,
+                "data": data or {},
+                "created_at": now,
+                "updated_at": now,
+                "version": 1,
+            }
+            
+            if self.auto_save:
+                self._mark_dirty(context_id)
+                if context_id in self._dirty:
+                    # Not snapshotted yet; log the full context so later
+                    # updates can be replayed on top of it
+                    self._append_log(context_id, {
+                        "v": 1,
+                        "ts": now,
+                        "data": self.contexts[context_id]["data"],
+                        "merge": False,
+                        "created_at": now,
+                    })
 
     def get_context(self, context_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve a context by ID.
@@ -80,30 +133,47 @@ class ContextManager(Component):
             data: New data to add to context
             merge: If True, merge with existing data; if False, replace
         """
-        if context_id not in self.contexts:
-            self.create_context(context_id, data)
-            return
+        with self._lock:
+            if context_id not in self.contexts:
+                self.create_context(context_id, data)
+                return
 
-        context = self.contexts[context_id]
-        
-        if merge:
-            context["data"].update(data)
-        else:
-            context["data"] = data
-        
-        context["updated_at"] = datetime.now().isoformat()
-        context["version"] += 1
-        
-        # Store in history
-        self.context_history.append({
-            "context_id": context_id,
-            "timestamp": datetime.now().isoformat(),
-            "version": context["version"],
-            "changes": list(data.keys()),
-        })
+            self._merge_into(context_id, data, merge)
+
+    def _merge_into(self, context_id: str, data: Dict[str, Any], merge: bool = True) -> None:
+        """Apply data to an existing context as a single new version.
         
-        if self.auto_save:
-            self.save_context(context_id)
+        Holds the lock throughout, so versions are assigned and logged in
+        the same order.
+        """
+        with self._lock:
+            context = self.contexts[context_id]
+            
+            if merge:
+                context["data"].update(data)
+            else:
+                context["data"] = data
+            
+            context["updated_at"] = datetime.now().isoformat()
+            context["version"] += 1
+            
+            # Store in history, reusing the timestamp formatted above
+            self.context_history.append({
+                "context_id": context_id,
+                "timestamp": context["updated_at"],
+                "version": context["version"],
+                "changes": list(data.keys()),
+            })
+            
+            if self.auto_save:
+                self._append_log(context_id, {
+                    "v": context["version"],
+                    "ts": context["updated_at"],
+                    "data": data,
+                    "merge": merge,
+                })
+                if context["version"] % self.snapshot_interval == 0:
+                    self._mark_dirty(context_id)
 
     def delete_context(self, context_id: str) -> bool:
         """Delete a context.
@@ -114,53 +184,163 @@ class ContextManager(Component):
         Returns:
             True if deleted, False if not found
         """
-        if context_id in self.contexts:
+        with self._lock:
+            if context_id not in self.contexts:
+                return False
             del self.contexts[context_id]
+            self._dirty.discard(context_id)
             
             # Delete from storage
-            context_file = self.storage_dir / f"{context_id}.json"
-            if context_file.exists():
-                context_file.unlink()
+            for suffix in (".json", ".msgpack"):
+                try:
+                    (self.storage_dir / f"{context_id}{suffix}").unlink()
+                except FileNotFoundError:
+                    pass
+            self._discard_log(context_id)
             
             return True
-        return False
 
     def save_context(self, context_id: str) -> None:
         """Save a context to disk.
         
+        The file is written to a temporary path and atomically moved into
+        place, so readers never observe a partially written context.
+        
         Args:
             context_id: Context identifier
         """
-        if context_id not in self.contexts:
+        context = self.contexts.get(context_id)
+        if context is None:
             return
 
-        context = self.contexts[context_id]
-        context_file = self.storage_dir / f"{context_id}.json"
+        suffix = self._snapshot_suffixes()[0]
+        context_file = self.storage_dir / f"{context_id}{suffix}"
+        tmp_file = context_file.with_suffix(f"{suffix}.tmp")
         
-        with open(context_file, "w") as f:
-            json.dump(context, f, indent=2)
+        with self._lock:
+            if suffix == ".msgpack":
+                data = msgpack.packb(context, use_bin_type=True)
+            else:
+                data = serialization.dumps(context)
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, context_file)
+            
+            # The snapshot supersedes every logged change
+            self._discard_log(context_id)
+
+    def flush(self) -> None:
+        """Save all contexts with pending auto-save changes."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            self._last_flush = time.monotonic()
+            for context_id in dirty:
+                self.save_context(context_id)
+
+    def _append_log(self, context_id: str, entry: Dict[str, Any]) -> None:
+        """Append a change entry to the context's JSONL change log."""
+        line = serialization.dumps(entry).decode("utf-8") + "\n"
+        with self._lock:
+            fh = self._log_fh.get(context_id)
+            if fh is None:
+                log_file = self.storage_dir / f"{context_id}.log"
+                fh = open(log_file, "a", buffering=1, encoding="utf-8")
+                self._log_fh[context_id] = fh
+            fh.write(line)
+
+    def _discard_log(self, context_id: str) -> None:
+        """Close and remove the context's change log."""
+        fh = self._log_fh.pop(context_id, None)
+        if fh is not None:
+            fh.close()
+        try:
+            (self.storage_dir / f"{context_id}.log").unlink()
+        except FileNotFoundError:
+            pass
+
+    def _replay_log(self, context_id: str, context: Dict[str, Any]) -> None:
+        """Apply logged changes newer than the loaded snapshot to context."""
+        try:
+            f = open(self.storage_dir / f"{context_id}.log", "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+
+        with f:
+            for line in f:
+                try:
+                    entry = serialization.loads(line)
+                except ValueError:
+                    # Torn write at the end of the log
+                    break
+                if "created_at" in entry:
+                    # The context was (re)created after the snapshot
+                    context["created_at"] = entry["created_at"]
+                elif entry["v"] <= context["version"]:
+                    continue
+                if entry["merge"]:
+                    context["data"].update(entry["data"])
+                else:
+                    context["data"] = entry["data"]
+                context["version"] = entry["v"]
+                context["updated_at"] = entry["ts"]
+
+    def _mark_dirty(self, context_id: str) -> None:
+        """Schedule a context for auto-save, flushing at most once per interval."""
+        with self._lock:
+            self._dirty.add(context_id)
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
 
     def load_context(self, context_id: str) -> bool:
         """Load a context from disk.
         
+        Changes logged since the last snapshot are replayed on top of it. A
+        context that was never snapshotted is rebuilt from its change log.
+        
         Args:
             context_id: Context identifier
             
         Returns:
             True if loaded successfully, False otherwise
         """
-        context_file = self.storage_dir / f"{context_id}.json"
-        
-        if not context_file.exists():
-            return False
+        raw = suffix = None
+        for suffix in self._snapshot_suffixes():
+            try:
+                raw = (self.storage_dir / f"{context_id}{suffix}").read_bytes()
+                break
+            except FileNotFoundError:
+                continue
 
         try:
-            with open(context_file, "r") as f:
-                self.contexts[context_id] = json.load(f)
-            return True
+            if raw is None:
+                context = {
+                    "id": context_id,
+                    "data": {},
+                    "created_at": None,
+                    "updated_at": None,
+                    "version": 0,
+                }
+            elif suffix == ".msgpack":
+                context = msgpack.unpackb(raw, raw=False)
+            else:
+                context = serialization.loads(raw)
+            self._replay_log(context_id, context)
         except Exception:
             return False
 
+        if context["created_at"] is None:
+            # Neither a snapshot nor a logged creation was found
+            return False
+        self.contexts[context_id] = context
+        return True
+
+    def _snapshot_suffixes(self) -> List[str]:
+        """Readable snapshot file suffixes, configured format first."""
+        if not MSGPACK_AVAILABLE:
+            return [".json"]
+        if self.storage_format == "msgpack":
+            return [".msgpack", ".json"]
+        return [".json", ".msgpack"]
+
     def list_contexts(self) -> List[str]:
         """List all available context IDs.
         
@@ -184,15 +364,16 @@ class ContextManager(Component):
         if not source:
             return False
 
-        shared_data = {}
-        for key in keys:
-            if key in source["data"]:
-                shared_data[key] = source["data"][key]
+        source_data = source["data"]
+        shared_data = {key: source_data[key] for key in keys if key in source_data}
+        if not shared_data:
+            return False
 
-        if shared_data:
-            self.update_context(target_id, shared_data)
-            return True
-        return False
+        if target_id in self.contexts:
+            self._merge_into(target_id, shared_data)
+        else:
+            self.create_context(target_id, shared_data)
+        return True
 
     @contextmanager
     def temp_context(self, context_id: str):
@@ -213,17 +394,35 @@ class ContextManager(Component):
     def get_status(self) -> Dict[str, Any]:
         """Get current context manager status."""
         return {
-            "enabled": self.is_enabled(),
-            "initialized": self.is_initialized(),
+            "enabled": self._enabled,
+            "initialized": self._initialized,
             "contexts_count": len(self.contexts),
-            "contexts": list(self.contexts.keys()),
+            "contexts": list(self.contexts),
             "storage_dir": str(self.storage_dir),
             "auto_save": self.auto_save,
             "history_count": len(self.context_history),
         }
 
+    def clear(self) -> None:
+        """Drop all in-memory contexts and history.
+        
+        Unsaved changes are discarded; files already written to the storage
+        directory are left in place.
+        """
+        self.contexts.clear()
+        self.context_history.clear()
+        with self._lock:
+            self._dirty.clear()
+            for fh in self._log_fh.values():
+                fh.close()
+            self._log_fh.clear()
+
     def cleanup(self) -> None:
         """Clean up context manager resources."""
-        if self.auto_save:
-            for context_id in self.contexts:
-                self.save_context(context_id)
+        with self._lock:
+            if self.auto_save:
+                self._dirty.update(self.contexts)
+                self.flush()
+            for fh in self._log_fh.values():
+                fh.close()
+            self._log_fh.clear()
@@ -1,6 +1,22 @@
 """Base component interface for modular architecture."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class ComponentProtocol(Protocol):
+    """Structural interface of a component.
+    
+    Any object providing these methods can be checked with
+    ``isinstance(obj, ComponentProtocol)`` without inheriting from
+    :class:`Component`.
+    """
+
+    def initialize(self) -> bool: ...
+
+    def validate(self) -> bool: ...
+
+    def get_status(self) -> Dict[str, Any]: ...
 
 
 class Component(ABC):
@@ -10,6 +26,8 @@ class Component(ABC):
     to ensure consistent behavior across the AIDeveloperTool ecosystem.
     """
 
+    __slots__ = ("name", "config", "_initialized", "_enabled")
+
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """Initialize a component.
         
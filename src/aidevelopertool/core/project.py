@@ -1,11 +1,79 @@
 """AIProject class for managing AI development projects."""
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import importlib
+import mmap
+import os
 import yaml
 from datetime import datetime
+from urllib.parse import quote
 
 from .component import Component
 
+# Prefer the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file through a read-only memory map.
+    
+    Args:
+        path: Path to the YAML file
+        
+    Returns:
+        Parsed document
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return yaml.load(b"", Loader=_Loader)
+        if hasattr(mmap, "MAP_PRIVATE"):
+            # Prefault the pages where supported (Linux, Python 3.10+)
+            flags = mmap.MAP_PRIVATE | getattr(mmap, "MAP_POPULATE", 0)
+            mapped = mmap.mmap(f.fileno(), 0, flags=flags, prot=mmap.PROT_READ)
+        else:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with mapped:
+            return yaml.load(mapped, Loader=_Loader)
+
+
+# Built-in component types that can be rebuilt from a saved config,
+# mapped to their modules. Imported on first use.
+_COMPONENT_TYPES = {
+    "EnvironmentChecker": "..setup.environment",
+    "ContextManager": "..context.manager",
+    "FeedbackTracker": "..feedback.tracker",
+    "PipelineManager": "..pipeline.manager",
+}
+
+
+def _component_type(type_name: Optional[str]) -> Optional[type]:
+    """Resolve a built-in component class by name.
+    
+    Args:
+        type_name: Class name as stored in the config
+        
+    Returns:
+        Component class, or None if it is not a built-in type
+    """
+    module = _COMPONENT_TYPES.get(type_name)
+    if module is None:
+        return None
+    return getattr(importlib.import_module(module, __package__), type_name)
+
+
+def _component_filename(name: str) -> str:
+    """Return the config file name for a component.
+    
+    Characters outside letters, digits and ``_.-~`` are percent-encoded,
+    so names such as ``team/ctx`` stay inside the components directory.
+    """
+    return quote(str(name), safe="") + ".yaml"
+
 
 class AIProject:
     """Main project management class.
@@ -15,16 +83,33 @@ class AIProject:
     different needs.
     """
 
-    def __init__(self, name: str, project_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        name: str,
+        project_dir: Optional[Path] = None,
+        components: Optional[List[Component]] = None,
+        parallel_init: bool = True
+    ):
         """Initialize an AI project.
         
         Args:
             name: Project name
             project_dir: Optional project directory path
+            components: Optional components to register, as with add_component
+            parallel_init: Whether to initialize components concurrently
         """
         self.name = name
         self.project_dir = project_dir or Path.cwd()
-        self.components: Dict[str, Component] = {}
+        self.parallel_init = parallel_init
+        components = components or []
+        self.components: Dict[str, Component] = {c.name: c for c in components}
+        # Bound validate methods, resolved once at registration
+        self._validate_fns: Dict[str, Callable[[], bool]] = {
+            c.name: c.validate for c in components
+        }
+        # Saved component configs, parsed on first access
+        self._component_paths: Dict[str, Path] = {}
+        self._component_configs: Dict[str, Dict[str, Any]] = {}
         self.metadata: Dict[str, Any] = {
             "name": name,
             "created_at": datetime.now().isoformat(),
@@ -39,6 +124,7 @@ class AIProject:
             component: Component instance to add
         """
         self.components[component.name] = component
+        self._validate_fns[component.name] = component.validate
 
     def remove_component(self, name: str) -> None:
         """Remove a component from the project.
@@ -49,6 +135,9 @@ class AIProject:
         if name in self.components:
             self.components[name].cleanup()
             del self.components[name]
+            del self._validate_fns[name]
+        self._component_paths.pop(name, None)
+        self._component_configs.pop(name, None)
 
     def get_component(self, name: str) -> Optional[Component]:
         """Get a component by name.
@@ -59,20 +148,76 @@ class AIProject:
         Returns:
             Component instance or None if not found
         """
-        return self.components.get(name)
+        component = self.components.get(name)
+        if component is None and self._has_saved_component(name):
+            component = self._build_component(name)
+        return component
+
+    def get_component_config(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the saved configuration of a component.
+        
+        The component's config file is only read on first access. A
+        missing file is treated as an empty config.
+        
+        Args:
+            name: Name of the component
+            
+        Returns:
+            Dictionary with type, config and enabled keys, or None if the
+            project has no saved config for the component
+        """
+        entry = self._component_configs.get(name)
+        if entry is None:
+            path = self._component_paths.get(name)
+            if path is None:
+                return None
+            try:
+                entry = _load_yaml_file(path) or {}
+            except FileNotFoundError:
+                entry = {}
+            self._component_configs[name] = entry
+        return entry
+
+    def _has_saved_component(self, name: str) -> bool:
+        """Check whether a component config was loaded from disk."""
+        return name in self._component_paths or name in self._component_configs
+
+    def _build_component(self, name: str) -> Optional[Component]:
+        """Create and register a built-in component from its saved config."""
+        entry = self.get_component_config(name)
+        component_type = _component_type(entry.get("type"))
+        if component_type is None:
+            return None
+        component = component_type(name, entry.get("config") or {})
+        if not entry.get("enabled", True):
+            component.disable()
+        self.add_component(component)
+        return component
 
     def initialize(self) -> bool:
         """Initialize the project and all components.
         
+        Unless ``parallel_init`` is disabled, components are initialized
+        concurrently, since their setup is independent and typically I/O
+        bound.
+        
         Returns:
             True if initialization was successful, False otherwise
         """
         if self._initialized:
             return True
 
+        components = list(self.components.values())
+        results: List[bool] = []
+        if self.parallel_init and len(components) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(components))) as executor:
+                results = list(executor.map(lambda c: c.initialize(), components))
+        else:
+            results = [component.initialize() for component in components]
+
         success = True
-        for component in self.components.values():
-            if not component.initialize():
+        for component, initialized in zip(components, results):
+            if not initialized:
                 success = False
                 print(f"Failed to initialize component: {component.name}")
 
@@ -85,10 +230,7 @@ class AIProject:
         Returns:
             Dictionary mapping component names to validation results
         """
-        results = {}
-        for name, component in self.components.items():
-            results[name] = component.validate()
-        return results
+        return {name: validate() for name, validate in self._validate_fns.items()}
 
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive project status.
@@ -108,7 +250,12 @@ class AIProject:
         }
 
     def save_config(self, config_path: Optional[Path] = None) -> None:
-        """Save project configuration to YAML file.
+        """Save project configuration to YAML files.
+        
+        The project file holds the metadata and the list of component
+        names; each component's config is written to
+        ``components/<name>.yaml`` next to it, with characters that are not
+        safe in file names percent-encoded.
         
         Args:
             config_path: Optional path to save config, defaults to project_dir/ai_project.yaml
@@ -116,37 +263,49 @@ class AIProject:
         if config_path is None:
             config_path = self.project_dir / "ai_project.yaml"
 
+        entries = {}
+        for name, component in self.components.items():
+            entries[name] = {
+                "type": type(component).__name__,
+                "config": component.config,
+                "enabled": component.is_enabled(),
+            }
+        # Keep saved components that were never materialized
+        for name in list(self._component_paths) + list(self._component_configs):
+            if name not in entries:
+                entries[name] = self.get_component_config(name)
+
         config = {
             "project": {
                 "name": self.name,
                 "metadata": self.metadata,
             },
-            "components": {
-                name: {
-                    "type": component.__class__.__name__,
-                    "config": component.config,
-                    "enabled": component.is_enabled(),
-                }
-                for name, component in self.components.items()
-            },
+            "components": list(entries),
         }
 
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        component_dir = config_path.parent / "components"
+        component_dir.mkdir(parents=True, exist_ok=True)
         with open(config_path, "w") as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False)
+        for name, entry in entries.items():
+            with open(component_dir / _component_filename(name), "w") as f:
+                yaml.dump(entry, f, Dumper=_Dumper, default_flow_style=False)
 
     @classmethod
     def load_config(cls, config_path: Path) -> "AIProject":
         """Load project from configuration file.
         
+        Only the project file is parsed here; component configs are read
+        when first requested via ``get_component`` or
+        ``get_component_config``.
+        
         Args:
             config_path: Path to configuration file
             
         Returns:
             AIProject instance
         """
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml_file(config_path)
 
         project_config = config.get("project", {})
         project = cls(
@@ -155,6 +314,15 @@ class AIProject:
         )
         project.metadata.update(project_config.get("metadata", {}))
 
+        components = config.get("components") or []
+        if isinstance(components, dict):
+            # Older files store component configs inline
+            project._component_configs.update(components)
+        else:
+            component_dir = config_path.parent / "components"
+            for name in components:
+                project._component_paths[name] = component_dir / _component_filename(name)
+
         return project
 
     def cleanup(self) -> None:
@@ -0,0 +1,55 @@
+"""JSON serialization helpers with an optional orjson fast path."""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+    
+    Uses orjson when installed, falling back to the standard library.
+    
+    Args:
+        obj: Object to serialize
+        indent: Whether to indent the output by two spaces
+        default: Optional function converting unsupported objects
+        
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    
+    if indent:
+        return json.dumps(
+            obj, indent=2, ensure_ascii=False, default=default
+        ).encode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=default
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Deserialized object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,13 +1,104 @@
 """Feedback tracker for actionable, explainable progress tracking."""
-from typing import Dict, Any, List, Optional, Callable
+from typing import BinaryIO, Deque, Dict, Any, List, Optional, Callable, NamedTuple
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
+from functools import partial
 from pathlib import Path
-import json
+from itertools import islice
+import queue
+import shutil
+import sys
+import threading
+import time
 
+from ..core import serialization
 from ..core.component import Component
 
 
+# Maximum number of queued events handled per background write
+_BATCH_SIZE = 128
+
+# Console symbol for each event level
+_LEVEL_SYMBOLS = {
+    "info": "ℹ",
+    "warning": "⚠",
+    "error": "✗",
+    "success": "✓",
+}
+
+
+def _report_error(message: str) -> None:
+    """Report an error raised on a background thread to stderr."""
+    sys.stderr.write(f"feedback: {message}\n")
+
+
+def _report_listener_error(listener: Callable, future: Future) -> None:
+    """Done-callback reporting an exception raised by a background listener."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        name = getattr(listener, "__qualname__", repr(listener))
+        _report_error(f"background listener {name} failed: {error!r}")
+
+
+def _intern(value: Any) -> Any:
+    """Intern plain strings; other values, including str subclasses, pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _iso(timestamp_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as a local ISO 8601 string."""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+class Event(NamedTuple):
+    """A logged feedback event.
+    
+    Stored as a tuple to keep per-event overhead low. Fields can also be
+    read by key (``event["message"]``), but the record is not a dict:
+    ``in``, iteration and JSON encoding behave as for a tuple. Use
+    ``to_dict`` where a dict is needed. The time is kept in nanoseconds
+    and only formatted when read through ``timestamp``.
+    """
+    timestamp_ns: int
+    message: str
+    level: str
+    category: str
+    metadata: Dict[str, Any]
+
+    @property
+    def timestamp(self) -> str:
+        """Event time as an ISO 8601 string."""
+        return _iso(self.timestamp_ns)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key != "timestamp" and key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by name, or default if there is no such field."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to a dictionary with an ISO timestamp."""
+        return {
+            "timestamp": self.timestamp,
+            "message": self.message,
+            "level": self.level,
+            "category": self.category,
+            "metadata": self.metadata,
+        }
+
+
 class FeedbackLevel(Enum):
     """Feedback detail level for different user types."""
     TECHNICAL = "technical"  # Detailed for coders
@@ -23,6 +114,24 @@ class FeedbackTracker(Component):
     and accessible to all stakeholders.
     """
 
+    __slots__ = (
+        "events",
+        "milestones",
+        "_completed_count",
+        "metrics",
+        "log_dir",
+        "default_level",
+        "enable_console",
+        "listeners",
+        "_q",
+        "_writer",
+        "_writer_lock",
+        "_event_log_path",
+        "_event_log",
+        "_background_listeners",
+        "_listener_executor",
+    )
+
     def __init__(self, name: str = "feedback", config: Optional[Dict[str, Any]] = None):
         """Initialize feedback tracker.
         
@@ -32,22 +141,39 @@ class FeedbackTracker(Component):
                 - default_level: Default feedback level
                 - log_dir: Directory to store feedback logs
                 - enable_console: Whether to print to console
+                - max_events: Number of most recent events kept in memory
+                - event_log: Whether to append events to log_dir/events.jsonl
         """
         super().__init__(name, config)
-        self.events: List[Dict[str, Any]] = []
-        self.milestones: List[Dict[str, Any]] = []
+        self.events: Deque[Event] = deque(maxlen=self.config.get("max_events", 100_000))
+        # Milestones keyed by name, in insertion order
+        self.milestones: Dict[str, Dict[str, Any]] = {}
+        self._completed_count = 0
         self.metrics: Dict[str, Any] = {}
         self.log_dir = Path(self.config.get("log_dir", "logs"))
         self.default_level = FeedbackLevel(
             self.config.get("default_level", "technical")
         )
         self.enable_console = self.config.get("enable_console", True)
+        # Listeners called inline by log_event, and listeners called on a
+        # background thread so slow callbacks do not block logging
         self.listeners: List[Callable] = []
+        self._background_listeners: List[Callable] = []
+        self._listener_executor: Optional[ThreadPoolExecutor] = None
+        # Event log lines are written by a background thread, started lazily
+        self._q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        # Events are streamed to a JSONL file once initialized
+        self._event_log_path: Optional[Path] = None
+        self._event_log: Optional[BinaryIO] = None
 
     def initialize(self) -> bool:
         """Initialize the feedback tracker."""
         if self.log_dir:
             self.log_dir.mkdir(parents=True, exist_ok=True)
+        if self.config.get("event_log", True):
+            self._event_log_path = self.log_dir / "events.jsonl"
         self._initialized = True
         return True
 
@@ -72,22 +198,37 @@ class FeedbackTracker(Component):
             metadata: Additional event metadata
             category: Event category for filtering
         """
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "message": message,
-            "level": level,
-            "category": category,
-            "metadata": metadata or {},
-        }
+        # Levels and categories repeat across events; share one string each
+        event = Event(
+            time.time_ns(),
+            message,
+            _intern(level),
+            _intern(category),
+            metadata or {},
+        )
         
         self.events.append(event)
         
         if self.enable_console:
+            # Printed inline so output stays in order with the caller's own
             self._print_event(event)
+        if self._event_log_path is not None:
+            self._enqueue(event)
         
-        # Notify listeners
+        # Notify listeners; they receive the event as a dict
+        if not (self.listeners or self._background_listeners):
+            return
+        record = event.to_dict()
         for listener in self.listeners:
-            listener(event)
+            listener(record)
+        if self._background_listeners:
+            executor = self._listener_executor
+            if executor is None:
+                executor = self._start_listener_executor()
+            for listener in self._background_listeners:
+                executor.submit(listener, record).add_done_callback(
+                    partial(_report_listener_error, listener)
+                )
 
     def add_milestone(
         self,
@@ -104,16 +245,22 @@ class FeedbackTracker(Component):
             completed: Whether milestone is completed
             metadata: Additional milestone metadata
         """
+        now = datetime.now().isoformat()
         milestone = {
             "name": name,
             "description": description,
             "completed": completed,
-            "created_at": datetime.now().isoformat(),
-            "completed_at": datetime.now().isoformat() if completed else None,
+            "created_at": now,
+            "completed_at": now if completed else None,
             "metadata": metadata or {},
         }
         
-        self.milestones.append(milestone)
+        replaced = self.milestones.get(name)
+        if replaced is not None and replaced["completed"]:
+            self._completed_count -= 1
+        self.milestones[name] = milestone
+        if completed:
+            self._completed_count += 1
         
         if completed:
             self.log_event(
@@ -131,17 +278,18 @@ class FeedbackTracker(Component):
         Returns:
             True if found and updated, False otherwise
         """
-        for milestone in self.milestones:
-            if milestone["name"] == name and not milestone["completed"]:
-                milestone["completed"] = True
-                milestone["completed_at"] = datetime.now().isoformat()
-                self.log_event(
-                    f"Milestone completed: {name}",
-                    level="success",
-                    category="milestone"
-                )
-                return True
-        return False
+        milestone = self.milestones.get(name)
+        if milestone is None or milestone["completed"]:
+            return False
+        milestone["completed"] = True
+        milestone["completed_at"] = datetime.now().isoformat()
+        self._completed_count += 1
+        self.log_event(
+            f"Milestone completed: {name}",
+            level="success",
+            category="milestone"
+        )
+        return True
 
     def update_metric(self, key: str, value: Any) -> None:
         """Update a project metric.
@@ -152,7 +300,7 @@ class FeedbackTracker(Component):
         """
         self.metrics[key] = {
             "value": value,
-            "updated_at": datetime.now().isoformat(),
+            "updated_at_ns": time.time_ns(),
         }
 
     def get_progress_summary(self, level: Optional[FeedbackLevel] = None) -> Dict[str, Any]:
@@ -167,7 +315,7 @@ class FeedbackTracker(Component):
         level = level or self.default_level
         
         total_milestones = len(self.milestones)
-        completed_milestones = sum(1 for m in self.milestones if m["completed"])
+        completed_milestones = self._completed_count
         
         summary = {
             "level": level.value,
@@ -175,19 +323,23 @@ class FeedbackTracker(Component):
             "milestones": {
                 "total": total_milestones,
                 "completed": completed_milestones,
-                "percentage": (completed_milestones / total_milestones * 100) 
+                # One division, so e.g. 2 of 3 is exactly 200 / 3
+                "percentage": (completed_milestones * 100 / total_milestones)
                              if total_milestones > 0 else 0,
             },
-            "recent_events": self.events[-5:] if self.events else [],
-            "metrics": self.metrics,
+            # Walk from the right end; indexing a deque from the left is O(n)
+            "recent_events": [
+                event.to_dict() for event in islice(reversed(self.events), 5)
+            ][::-1],
+            "metrics": self._format_metrics(),
         }
         
         if level == FeedbackLevel.TECHNICAL:
-            summary["all_events"] = self.events
-            summary["all_milestones"] = self.milestones
+            summary["all_events"] = [event.to_dict() for event in self.events]
+            summary["all_milestones"] = list(self.milestones.values())
         elif level == FeedbackLevel.EXECUTIVE:
             summary["key_milestones"] = [
-                m for m in self.milestones 
+                m for m in self.milestones.values()
                 if m.get("metadata", {}).get("executive_visibility", False)
             ]
         elif level == FeedbackLevel.CREATIVE:
@@ -195,21 +347,30 @@ class FeedbackTracker(Component):
         
         return summary
 
+    def _format_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Return the metrics with ISO ``updated_at`` timestamps."""
+        return {
+            key: {"value": metric["value"], "updated_at": _iso(metric["updated_at_ns"])}
+            for key, metric in self.metrics.items()
+        }
+
     def _generate_story(self) -> str:
         """Generate a narrative story from events and milestones."""
         story_parts = []
         
         if self.milestones:
-            completed = [m for m in self.milestones if m["completed"]]
-            pending = [m for m in self.milestones if not m["completed"]]
+            completed = self._completed_count
+            pending = next(
+                (m for m in self.milestones.values() if not m["completed"]), None
+            )
             
             story_parts.append(
-                f"Journey so far: {len(completed)} milestones achieved"
+                f"Journey so far: {completed} milestones achieved"
             )
             
             if pending:
                 story_parts.append(
-                    f"Next up: {pending[0]['name']} - {pending[0]['description']}"
+                    f"Next up: {pending['name']} - {pending['description']}"
                 )
         
         return " | ".join(story_parts)
@@ -224,18 +385,18 @@ class FeedbackTracker(Component):
             Explainable status with reasoning
         """
         # Check milestones
-        for milestone in self.milestones:
-            if milestone["name"] == item:
-                return {
-                    "item": item,
-                    "type": "milestone",
-                    "status": "completed" if milestone["completed"] else "pending",
-                    "explanation": milestone["description"],
-                    "timeline": {
-                        "created": milestone["created_at"],
-                        "completed": milestone.get("completed_at"),
-                    },
-                }
+        milestone = self.milestones.get(item)
+        if milestone is not None:
+            return {
+                "item": item,
+                "type": "milestone",
+                "status": "completed" if milestone["completed"] else "pending",
+                "explanation": milestone["description"],
+                "timeline": {
+                    "created": milestone["created_at"],
+                    "completed": milestone.get("completed_at"),
+                },
+            }
         
         # Check metrics
         if item in self.metrics:
@@ -244,7 +405,7 @@ class FeedbackTracker(Component):
                 "type": "metric",
                 "value": self.metrics[item]["value"],
                 "explanation": f"Current value: {self.metrics[item]['value']}",
-                "last_updated": self.metrics[item]["updated_at"],
+                "last_updated": _iso(self.metrics[item]["updated_at_ns"]),
             }
         
         return {
@@ -254,13 +415,20 @@ class FeedbackTracker(Component):
             "explanation": f"No information available for: {item}",
         }
 
-    def add_listener(self, callback: Callable) -> None:
+    def add_listener(self, callback: Callable, background: bool = False) -> None:
         """Add a listener for feedback events.
         
         Args:
-            callback: Function to call on events
+            callback: Function to call with each event, as a dictionary
+                with timestamp, message, level, category and metadata keys
+            background: Call the listener on a background thread instead of
+                inside log_event. Background listeners receive events in
+                order, one at a time.
         """
-        self.listeners.append(callback)
+        if background:
+            self._background_listeners.append(callback)
+        else:
+            self.listeners.append(callback)
 
     def export_report(self, filepath: Optional[Path] = None) -> Path:
         """Export full feedback report to JSON.
@@ -271,39 +439,178 @@ class FeedbackTracker(Component):
         Returns:
             Path to exported report
         """
+        now = datetime.now()
         if filepath is None:
-            filepath = self.log_dir / f"feedback_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filepath = self.log_dir / f"feedback_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         report = {
-            "generated_at": datetime.now().isoformat(),
-            "events": self.events,
-            "milestones": self.milestones,
-            "metrics": self.metrics,
+            "generated_at": now.isoformat(),
+            "events": [event.to_dict() for event in self.events],
+            "milestones": list(self.milestones.values()),
+            "metrics": self._format_metrics(),
             "summary": self.get_progress_summary(),
         }
         
         filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(report, f, indent=2)
+        filepath.write_bytes(serialization.dumps(report, indent=True))
+        
+        return filepath
+
+    def export_events(self, filepath: Optional[Path] = None) -> Path:
+        """Export all streamed events as JSON Lines.
+        
+        Copies the event log file instead of re-serializing the events, so
+        it also includes events no longer kept in memory.
+        
+        Args:
+            filepath: Optional output file path
+            
+        Returns:
+            Path to exported events
+            
+        Raises:
+            ValueError: If the event log is disabled or the tracker has not
+                been initialized
+        """
+        if self._event_log_path is None:
+            raise ValueError("Event log is not enabled")
+        if filepath is None:
+            filepath = self.log_dir / f"events_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
         
+        self.flush()
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            shutil.copyfile(self._event_log_path, filepath)
+        except FileNotFoundError:
+            # Nothing has been logged yet
+            filepath.write_bytes(b"")
         return filepath
 
-    def _print_event(self, event: Dict[str, Any]) -> None:
+    def clear(self) -> None:
+        """Forget all recorded events, milestones and metrics.
+        
+        Listeners and events already written to the event log are kept.
+        """
+        self.events.clear()
+        self.milestones.clear()
+        self._completed_count = 0
+        self.metrics.clear()
+
+    def flush(self) -> None:
+        """Block until all queued events have been written."""
+        writer = self._writer
+        if writer is None:
+            return
+        marker = threading.Event()
+        self._q.put(marker)
+        # Do not wait forever if the writer thread is gone
+        while not marker.wait(timeout=0.5):
+            if not writer.is_alive():
+                return
+
+    def cleanup(self) -> None:
+        """Flush pending output and stop the background threads."""
+        with self._writer_lock:
+            executor, self._listener_executor = self._listener_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        
+        with self._writer_lock:
+            writer = self._writer
+            if writer is None:
+                return
+            self._q.put(None)
+            writer.join()
+            self._writer = None
+            if self._event_log is not None:
+                self._event_log.close()
+                self._event_log = None
+
+    def _start_listener_executor(self) -> ThreadPoolExecutor:
+        """Create the background listener thread pool if needed."""
+        with self._writer_lock:
+            if self._listener_executor is None:
+                self._listener_executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix=f"{self.name}-listener",
+                )
+            return self._listener_executor
+
+    def _enqueue(self, event: Event) -> None:
+        """Hand an event to the background writer, starting it if needed."""
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._drain,
+                        name=f"{self.name}-writer",
+                        daemon=True,
+                    )
+                    self._writer.start()
+        self._q.put(event)
+
+    def _drain(self) -> None:
+        """Background writer loop: write queued events in batches."""
+        while True:
+            batch = [self._q.get()]
+            while len(batch) < _BATCH_SIZE:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            events = []
+            for item in batch:
+                if isinstance(item, Event):
+                    events.append(item)
+                    continue
+                # Flush marker or stop sentinel: write everything before it first
+                if events:
+                    self._write_events(events)
+                    events = []
+                if item is None:
+                    return
+                item.set()
+            if events:
+                self._write_events(events)
+
+    def _write_events(self, events: List[Event]) -> None:
+        """Write a batch of events, reporting errors instead of raising.
+        
+        The events stay in memory; only their output is lost. A failed
+        event log is reopened on the next batch.
+        """
+        try:
+            self._output_events(events)
+        except Exception as e:
+            if self._event_log is not None:
+                try:
+                    self._event_log.close()
+                except OSError:
+                    pass
+                self._event_log = None
+            _report_error(f"failed to write {len(events)} event(s): {e}")
+
+    def _output_events(self, events: List[Event]) -> None:
+        """Append a batch of events to the event log."""
+        if self._event_log is None:
+            self._event_log = open(self._event_log_path, "ab", buffering=1 << 16)
+        self._event_log.write(b"".join(
+            serialization.dumps(event.to_dict(), default=str) + b"\n"
+            for event in events
+        ))
+        self._event_log.flush()
+
+    def _print_event(self, event: Event) -> None:
         """Print event to console with formatting."""
-        level_symbols = {
-            "info": "ℹ",
-            "warning": "⚠",
-            "error": "✗",
-            "success": "✓",
-        }
-        symbol = level_symbols.get(event["level"], "•")
-        print(f"{symbol} [{event['category']}] {event['message']}")
+        symbol = _LEVEL_SYMBOLS.get(event.level, "•")
+        print(f"{symbol} [{event.category}] {event.message}")
 
     def get_status(self) -> Dict[str, Any]:
         """Get current feedback tracker status."""
         return {
-            "enabled": self.is_enabled(),
-            "initialized": self.is_initialized(),
+            "enabled": self._enabled,
+            "initialized": self._initialized,
             "events_count": len(self.events),
             "milestones_count": len(self.milestones),
             "metrics_count": len(self.metrics),
@@ -1,11 +1,74 @@
 """Pipeline manager for workflow automation."""
-from typing import Dict, Any, List, Optional, Callable
+from typing import Collection, Dict, Any, List, Optional, Callable
 from datetime import datetime
 from enum import Enum
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import os
+import random
+import threading
 
 from ..core.component import Component
 
+def _kahn_waves(indptr, indices, in_degree, roots, order, wave_starts) -> int:
+    """Kahn's algorithm over a CSR successor graph.
+    
+    Consumes ``in_degree``. Fills ``order`` with task indices wave by wave
+    and ``wave_starts`` with the offset of each wave, followed by the
+    total number of ordered tasks.
+    
+    Returns:
+        Number of waves
+    """
+    n_ordered = 0
+    for r in range(len(roots)):
+        order[n_ordered] = roots[r]
+        n_ordered += 1
+    
+    n_waves = 0
+    start = 0
+    while start < n_ordered:
+        wave_starts[n_waves] = start
+        n_waves += 1
+        end = n_ordered
+        for p in range(start, end):
+            i = order[p]
+            for k in range(indptr[i], indptr[i + 1]):
+                successor = indices[k]
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    order[n_ordered] = successor
+                    n_ordered += 1
+        start = end
+    wave_starts[n_waves] = n_ordered
+    return n_waves
+
+
+def _topological_waves(
+    indptr: array,
+    indices: array,
+    deps_count: array,
+    roots: List[int]
+) -> List[List[int]]:
+    """Group task indices into dependency waves."""
+    n = len(deps_count)
+    in_degree = array("i", deps_count)
+    order = array("i", bytes(in_degree.itemsize * n))
+    wave_starts = array("i", bytes(in_degree.itemsize * (n + 1)))
+    
+    n_waves = _kahn_waves(indptr, indices, in_degree, roots, order, wave_starts)
+    
+    return [
+        list(order[wave_starts[w]:wave_starts[w + 1]])
+        for w in range(n_waves)
+    ]
+
+
+# Depth-first search states used by Pipeline.validate
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
 
 class TaskStatus(Enum):
     """Status of a pipeline task."""
@@ -16,9 +79,31 @@ class TaskStatus(Enum):
     SKIPPED = "skipped"
 
 
+# Module-level aliases: one global lookup, and identity checks instead of
+# Enum.__eq__ in the scheduling loops
+_PENDING = TaskStatus.PENDING
+_RUNNING = TaskStatus.RUNNING
+_COMPLETED = TaskStatus.COMPLETED
+_FAILED = TaskStatus.FAILED
+_SKIPPED = TaskStatus.SKIPPED
+
+
 class Task:
     """Represents a single task in a pipeline."""
 
+    __slots__ = (
+        "name",
+        "func",
+        "description",
+        "dependencies",
+        "metadata",
+        "status",
+        "result",
+        "error",
+        "started_at",
+        "completed_at",
+    )
+
     def __init__(
         self,
         name: str,
@@ -39,19 +124,20 @@ class Task:
         self.name = name
         self.func = func
         self.description = description
-        self.dependencies = dependencies or []
+        self.dependencies = tuple(dependencies or ())
         self.metadata = metadata or {}
-        self.status = TaskStatus.PENDING
+        self.status = _PENDING
         self.result = None
         self.error = None
         self.started_at: Optional[str] = None
         self.completed_at: Optional[str] = None
 
-    def can_run(self, completed_tasks: List[str]) -> bool:
+    def can_run(self, completed_tasks: Collection[str]) -> bool:
         """Check if this task can run based on dependencies.
         
         Args:
-            completed_tasks: List of completed task names
+            completed_tasks: Completed task names; pass a set for
+                constant-time membership checks
             
         Returns:
             True if all dependencies are satisfied
@@ -67,15 +153,50 @@ class Task:
         Returns:
             Task result
         """
-        self.status = TaskStatus.RUNNING
+        self.status = _RUNNING
         self.started_at = datetime.now().isoformat()
         
         try:
             self.result = self.func(context)
-            self.status = TaskStatus.COMPLETED
+            self.status = _COMPLETED
             return self.result
         except Exception as e:
-            self.status = TaskStatus.FAILED
+            self.status = _FAILED
+            self.error = str(e)
+            raise
+        finally:
+            self.completed_at = datetime.now().isoformat()
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the task function is a coroutine function."""
+        return asyncio.iscoroutinefunction(self.func)
+
+    async def execute_async(self, context: Dict[str, Any]) -> Any:
+        """Execute the task on the running event loop.
+        
+        Coroutine functions are awaited directly; plain functions run in
+        the loop's default executor so they do not block other tasks.
+        
+        Args:
+            context: Shared context for task execution
+            
+        Returns:
+            Task result
+        """
+        if not self.is_async:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.execute, context)
+        
+        self.status = _RUNNING
+        self.started_at = datetime.now().isoformat()
+        
+        try:
+            self.result = await self.func(context)
+            self.status = _COMPLETED
+            return self.result
+        except Exception as e:
+            self.status = _FAILED
             self.error = str(e)
             raise
         finally:
@@ -86,7 +207,7 @@ class Task:
         return {
             "name": self.name,
             "description": self.description,
-            "dependencies": self.dependencies,
+            "dependencies": list(self.dependencies),
             "status": self.status.value,
             "result": self.result,
             "error": self.error,
@@ -95,10 +216,38 @@ class Task:
             "metadata": self.metadata,
         }
 
+    def reset(self) -> None:
+        """Reset execution state so the task can run again."""
+        self.status = _PENDING
+        self.result = None
+        self.error = None
+        self.started_at = None
+        self.completed_at = None
+
 
 class Pipeline:
     """Represents a workflow pipeline."""
 
+    __slots__ = (
+        "name",
+        "description",
+        "tasks",
+        "execution_order",
+        "context",
+        "_in_degree",
+        "_succ",
+        "_ready",
+        "_plan",
+        "_plan_dirty",
+        "_errors",
+        "_names",
+        "_index",
+        "_deps_count",
+        "_succ_indptr",
+        "_succ_indices",
+        "_roots",
+    )
+
     def __init__(self, name: str, description: str = ""):
         """Initialize a pipeline.
         
@@ -111,6 +260,21 @@ class Pipeline:
         self.tasks: Dict[str, Task] = {}
         self.execution_order: List[str] = []
         self.context: Dict[str, Any] = {}
+        # Dependency graph, maintained incrementally by add_task/remove_task
+        self._in_degree: Dict[str, int] = {}
+        self._succ: Dict[str, List[str]] = {}
+        self._ready: List[str] = []
+        self._plan: List[List[str]] = []
+        self._plan_dirty = True
+        # Result of validate() for the current task set, None until computed
+        self._errors: Optional[List[str]] = None
+        # Compiled graph: task names interned to ints, successors in CSR form
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._deps_count = array("i")
+        self._succ_indptr = array("i", [0])
+        self._succ_indices = array("i")
+        self._roots: List[int] = []
 
     def add_task(self, task: Task) -> None:
         """Add a task to the pipeline.
@@ -118,7 +282,17 @@ class Pipeline:
         Args:
             task: Task to add
         """
+        if task.name in self.tasks:
+            self.remove_task(task.name)
+        
         self.tasks[task.name] = task
+        self._in_degree[task.name] = len(task.dependencies)
+        for dep in task.dependencies:
+            self._succ.setdefault(dep, []).append(task.name)
+        if not task.dependencies:
+            self._ready.append(task.name)
+        self._plan_dirty = True
+        self._errors = None
 
     def remove_task(self, name: str) -> None:
         """Remove a task from the pipeline.
@@ -127,51 +301,142 @@ class Pipeline:
             name: Task name
         """
         if name in self.tasks:
-            del self.tasks[name]
+            task = self.tasks.pop(name)
+            del self._in_degree[name]
+            for dep in task.dependencies:
+                successors = self._succ[dep]
+                successors.remove(name)
+                if not successors:
+                    del self._succ[dep]
+            if name in self._ready:
+                self._ready.remove(name)
+            self._plan_dirty = True
+            self._errors = None
+
+    def finalize(self) -> List[List[str]]:
+        """Compile the execution plan using Kahn's algorithm.
+        
+        The plan is cached until the task set changes.
+        
+        Returns:
+            Waves of task names; every task in a wave only depends on
+            tasks in earlier waves
+        """
+        if not self._plan_dirty:
+            return self._plan
+        
+        names = list(self.tasks)
+        index = {name: i for i, name in enumerate(names)}
+        indptr = array("i", [0])
+        indices = array("i")
+        for name in names:
+            indices.extend(index[successor] for successor in self._succ.get(name, ()))
+            indptr.append(len(indices))
+        
+        self._names = names
+        self._index = index
+        self._deps_count = array("i", (self._in_degree[name] for name in names))
+        self._succ_indptr = indptr
+        self._succ_indices = indices
+        self._roots = [index[name] for name in self._ready]
+        
+        waves = _topological_waves(indptr, indices, self._deps_count, self._roots)
+        plan = [[names[i] for i in wave] for wave in waves]
+        
+        self._plan = plan
+        self._plan_dirty = False
+        return plan
 
     def validate(self) -> List[str]:
         """Validate pipeline configuration.
         
+        Runs a single iterative depth-first search over the dependency
+        graph, reporting tasks that are part of or depend on a cycle, and
+        dependencies on tasks that do not exist.
+        
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        state = dict.fromkeys(self.tasks, _WHITE)
+        cyclic = set()
         
-        # Check for circular dependencies
-        for task_name, task in self.tasks.items():
-            if self._has_circular_dependency(task_name):
-                errors.append(f"Circular dependency detected for task: {task_name}")
+        for root in self.tasks:
+            if state[root] != _WHITE:
+                continue
+            state[root] = _GRAY
+            stack = [(root, iter(self.tasks[root].dependencies))]
+            while stack:
+                name, deps = stack[-1]
+                for dep in deps:
+                    dep_state = state.get(dep)
+                    if dep_state is None:
+                        # Missing; reported below in declaration order
+                        continue
+                    if dep_state == _WHITE:
+                        state[dep] = _GRAY
+                        stack.append((dep, iter(self.tasks[dep].dependencies)))
+                        break
+                    elif dep_state == _GRAY or dep in cyclic:
+                        # Back edge into the current path, or a finished
+                        # task that leads to a cycle
+                        cyclic.add(name)
+                else:
+                    state[name] = _BLACK
+                    stack.pop()
+                    if stack and name in cyclic:
+                        cyclic.add(stack[-1][0])
         
-        # Check for missing dependencies
+        errors = [
+            f"Circular dependency detected for task: {task_name}"
+            for task_name in self.tasks
+            if task_name in cyclic
+        ]
         for task_name, task in self.tasks.items():
-            for dep in task.dependencies:
-                if dep not in self.tasks:
-                    errors.append(f"Task '{task_name}' depends on missing task '{dep}'")
-        
+            errors.extend(
+                f"Task '{task_name}' depends on missing task '{dep}'"
+                for dep in task.dependencies
+                if dep not in state
+            )
         return errors
 
-    def _has_circular_dependency(self, task_name: str, visited: Optional[set] = None) -> bool:
-        """Check if a task has circular dependencies."""
-        if visited is None:
-            visited = set()
-        
-        if task_name in visited:
-            return True
+    def execute(
+        self,
+        initial_context: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Execute the pipeline.
         
-        visited.add(task_name)
-        task = self.tasks.get(task_name)
+        Independent tasks run concurrently on a pool of worker threads.
+        Each worker owns a deque of ready tasks; idle workers steal from
+        the tail of a random peer's deque. Pipelines containing coroutine
+        tasks are driven by ``execute_async`` on a fresh event loop.
         
-        if not task:
-            return False
+        Args:
+            initial_context: Initial context for pipeline execution
+            max_workers: Maximum number of worker threads (defaults to CPU count)
+            
+        Returns:
+            Execution results
+        """
+        errors = self._prepare(initial_context)
+        if errors:
+            return self._validation_failure(errors)
         
-        for dep in task.dependencies:
-            if self._has_circular_dependency(dep, visited.copy()):
-                return True
+        if any(task.is_async for task in self.tasks.values()):
+            return asyncio.run(self._execute_async())
         
-        return False
+        run = _WorkStealingRun(self, max_workers)
+        run.execute()
+        return self._finish(run.completed_tasks, run.failed_tasks)
 
-    def execute(self, initial_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Execute the pipeline.
+    async def execute_async(
+        self,
+        initial_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute the pipeline on the running event loop.
+        
+        Coroutine tasks run concurrently on the loop; a task is launched as
+        soon as all of its dependencies have completed.
         
         Args:
             initial_context: Initial context for pipeline execution
@@ -179,47 +444,102 @@ class Pipeline:
         Returns:
             Execution results
         """
+        errors = self._prepare(initial_context)
+        if errors:
+            return self._validation_failure(errors)
+        return await self._execute_async()
+
+    async def _execute_async(self) -> Dict[str, Any]:
+        """Drive the compiled plan with asyncio."""
+        self.finalize()
+        names = self._names
+        tasks = [self.tasks[name] for name in names]
+        indptr, indices = self._succ_indptr, self._succ_indices
+        remaining = array("i", self._deps_count)
+        completed_tasks: List[str] = []
+        failed_tasks: List[str] = []
+        
+        def launch(i: int) -> "asyncio.Future":
+            return asyncio.ensure_future(tasks[i].execute_async(self.context))
+        
+        running = {launch(i): i for i in self._roots}
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    i = running.pop(future)
+                    if future.exception() is not None:
+                        failed_tasks.append(names[i])
+                        self._skip_dependents(i)
+                        continue
+                    completed_tasks.append(names[i])
+                    self.execution_order.append(names[i])
+                    for k in range(indptr[i], indptr[i + 1]):
+                        successor = indices[k]
+                        remaining[successor] -= 1
+                        if remaining[successor] == 0:
+                            running[launch(successor)] = successor
+        finally:
+            # On cancellation, stop tasks that are still running and wait
+            # for them to unwind so none outlive the run
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        
+        return self._finish(completed_tasks, failed_tasks)
+
+    def _prepare(self, initial_context: Optional[Dict[str, Any]]) -> List[str]:
+        """Reset run state and validate before execution.
+        
+        The validation result is cached alongside the compiled plan and
+        recomputed only after the task set changes.
+        
+        Returns:
+            List of validation errors (empty if valid)
+        """
         self.context = initial_context or {}
-        completed_tasks = []
-        failed_tasks = []
+        self.execution_order = []
         
-        # Validate before execution
-        errors = self.validate()
-        if errors:
-            return {
-                "success": False,
-                "errors": errors,
-                "completed_tasks": [],
-                "failed_tasks": [],
-            }
+        if self._errors is None:
+            self._errors = self.validate()
+        errors = list(self._errors)
+        if not errors:
+            for task in self.tasks.values():
+                task.reset()
+        return errors
+
+    def _validation_failure(self, errors: List[str]) -> Dict[str, Any]:
+        """Build the result for a pipeline that failed validation."""
+        return {
+            "success": False,
+            "errors": errors,
+            "completed_tasks": [],
+            "failed_tasks": [],
+        }
+
+    def _skip_dependents(self, index: int) -> None:
+        """Mark every task downstream of a failed task as skipped.
         
-        # Execute tasks in order
-        while len(completed_tasks) + len(failed_tasks) < len(self.tasks):
-            runnable_tasks = [
-                task for task in self.tasks.values()
-                if task.status == TaskStatus.PENDING and task.can_run(completed_tasks)
-            ]
-            
-            if not runnable_tasks:
-                # Check if we're stuck
-                pending_tasks = [
-                    task for task in self.tasks.values()
-                    if task.status == TaskStatus.PENDING
-                ]
-                if pending_tasks:
-                    # Mark remaining as skipped
-                    for task in pending_tasks:
-                        task.status = TaskStatus.SKIPPED
-                break
-            
-            for task in runnable_tasks:
-                try:
-                    task.execute(self.context)
-                    completed_tasks.append(task.name)
-                    self.execution_order.append(task.name)
-                except Exception:
-                    failed_tasks.append(task.name)
+        Walks the compiled successor graph breadth-first. None of these
+        tasks can have started, since each depends on the failed task.
         
+        Args:
+            index: Compiled index of the failed task
+        """
+        indptr, indices = self._succ_indptr, self._succ_indices
+        queue = deque([index])
+        while queue:
+            i = queue.popleft()
+            for k in range(indptr[i], indptr[i + 1]):
+                successor = indices[k]
+                task = self.tasks[self._names[successor]]
+                if task.status is not _SKIPPED:
+                    task.status = _SKIPPED
+                    queue.append(successor)
+
+    def _finish(self, completed_tasks: List[str], failed_tasks: List[str]) -> Dict[str, Any]:
+        """Build the execution result."""
         return {
             "success": len(failed_tasks) == 0,
             "completed_tasks": completed_tasks,
@@ -230,20 +550,138 @@ class Pipeline:
 
     def get_status(self) -> Dict[str, Any]:
         """Get pipeline status."""
-        status_counts = {status: 0 for status in TaskStatus}
-        for task in self.tasks.values():
-            status_counts[task.status] += 1
+        status_counts = Counter(task.status for task in self.tasks.values())
         
         return {
             "name": self.name,
             "description": self.description,
             "total_tasks": len(self.tasks),
-            "status_counts": {k.value: v for k, v in status_counts.items()},
+            "status_counts": {status.value: status_counts[status] for status in TaskStatus},
             "execution_order": self.execution_order,
             "tasks": {name: task.to_dict() for name, task in self.tasks.items()},
         }
 
 
+class _WorkStealingRun:
+    """State for a single work-stealing execution of a pipeline."""
+
+    def __init__(self, pipeline: Pipeline, max_workers: Optional[int] = None):
+        """Seed per-worker ready deques from the pipeline's compiled plan.
+        
+        Args:
+            pipeline: Pipeline to execute
+            max_workers: Maximum number of worker threads
+        """
+        pipeline.finalize()
+        self.pipeline = pipeline
+        self.names = pipeline._names
+        self.tasks = [pipeline.tasks[name] for name in self.names]
+        self.indptr = pipeline._succ_indptr
+        self.indices = pipeline._succ_indices
+        self.remaining = array("i", pipeline._deps_count)
+        
+        workers = max_workers or os.cpu_count() or 1
+        self.num_workers = max(1, min(workers, len(pipeline.tasks)))
+        self.queues: List[deque] = [deque() for _ in range(self.num_workers)]
+        for n, i in enumerate(pipeline._roots):
+            self.queues[n % self.num_workers].append(i)
+        
+        self.completed_tasks: List[str] = []
+        self.failed_tasks: List[str] = []
+        self.running = 0
+        # Set when a task raised a non-Exception error such as KeyboardInterrupt
+        self.aborted = False
+        self.cond = threading.Condition()
+
+    def execute(self) -> None:
+        """Run all workers until no task is ready or in flight."""
+        if not self.pipeline.tasks:
+            return
+        if self.num_workers == 1:
+            self._run_inline()
+            return
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [
+                executor.submit(self._work, index)
+                for index in range(self.num_workers)
+            ]
+        # Re-raise errors that escaped a worker, e.g. KeyboardInterrupt
+        for future in futures:
+            future.result()
+
+    def _run_inline(self) -> None:
+        """Run every task on the calling thread, without locking."""
+        context = self.pipeline.context
+        ready = self.queues[0]
+        while ready:
+            i = ready.popleft()
+            try:
+                self.tasks[i].execute(context)
+                succeeded = True
+            except Exception:
+                succeeded = False
+            self._record(i, succeeded, ready)
+
+    def _record(self, i: int, succeeded: bool, ready: deque) -> None:
+        """Record a finished task and queue successors that became ready.
+        
+        Callers running workers must hold ``cond``.
+        """
+        if succeeded:
+            self.completed_tasks.append(self.names[i])
+            self.pipeline.execution_order.append(self.names[i])
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                successor = self.indices[k]
+                self.remaining[successor] -= 1
+                if self.remaining[successor] == 0:
+                    ready.appendleft(successor)
+        else:
+            self.failed_tasks.append(self.names[i])
+            self.pipeline._skip_dependents(i)
+
+    def _next_task(self, index: int) -> Optional[int]:
+        """Pop from the worker's own head, else steal from a random peer's tail."""
+        own = self.queues[index]
+        if own:
+            return own.popleft()
+        victims = [i for i in range(self.num_workers) if i != index]
+        random.shuffle(victims)
+        for victim in victims:
+            if self.queues[victim]:
+                return self.queues[victim].pop()
+        return None
+
+    def _work(self, index: int) -> None:
+        """Worker loop: run ready tasks and release their successors."""
+        context = self.pipeline.context
+        while True:
+            with self.cond:
+                i = None if self.aborted else self._next_task(index)
+                while i is None:
+                    if self.running == 0 or self.aborted:
+                        self.cond.notify_all()
+                        return
+                    self.cond.wait()
+                    i = None if self.aborted else self._next_task(index)
+                self.running += 1
+            
+            succeeded = None
+            try:
+                self.tasks[i].execute(context)
+                succeeded = True
+            except Exception:
+                succeeded = False
+            finally:
+                with self.cond:
+                    self.running -= 1
+                    if succeeded is None:
+                        # The error propagates; stop the other workers too
+                        self.aborted = True
+                    else:
+                        self._record(i, succeeded, self.queues[index])
+                    self.cond.notify_all()
+
+
 class PipelineManager(Component):
     """Manages multiple pipelines for workflow automation.
     
@@ -251,12 +689,15 @@ class PipelineManager(Component):
     and making pipeline management accessible to all users.
     """
 
+    __slots__ = ("pipelines",)
+
     def __init__(self, name: str = "pipeline", config: Optional[Dict[str, Any]] = None):
         """Initialize pipeline manager.
         
         Args:
             name: Component name
-            config: Configuration dictionary
+            config: Configuration dictionary with:
+                - max_workers: Maximum worker threads per pipeline run
         """
         super().__init__(name, config)
         self.pipelines: Dict[str, Pipeline] = {}
@@ -334,7 +775,30 @@ class PipelineManager(Component):
                 "error": f"Pipeline not found: {name}",
             }
         
-        return pipeline.execute(context)
+        return pipeline.execute(context, max_workers=self.config.get("max_workers"))
+
+    async def execute_pipeline_async(
+        self,
+        name: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Execute a pipeline by name on the running event loop.
+        
+        Args:
+            name: Pipeline name
+            context: Initial context
+            
+        Returns:
+            Execution results
+        """
+        pipeline = self.get_pipeline(name)
+        if not pipeline:
+            return {
+                "success": False,
+                "error": f"Pipeline not found: {name}",
+            }
+        
+        return await pipeline.execute_async(context)
 
     def list_pipelines(self) -> List[str]:
         """List all pipeline names.
@@ -347,8 +811,8 @@ class PipelineManager(Component):
     def get_status(self) -> Dict[str, Any]:
         """Get pipeline manager status."""
         return {
-            "enabled": self.is_enabled(),
-            "initialized": self.is_initialized(),
+            "enabled": self._enabled,
+            "initialized": self._initialized,
             "pipelines_count": len(self.pipelines),
             "pipelines": {
                 name: pipeline.get_status()
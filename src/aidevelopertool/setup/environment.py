@@ -1,12 +1,114 @@
 """Environment checker for automated setup validation."""
+import importlib.util
+import os
+import stat
 import sys
-import subprocess
-import shutil
-from typing import Dict, Any, List, Optional
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
 from ..core.component import Component
 
+# The interpreter version cannot change while the process runs
+_CURRENT_PY = (sys.version_info.major, sys.version_info.minor)
+_CURRENT_PY_STR = f"{_CURRENT_PY[0]}.{_CURRENT_PY[1]}"
+_FULL_PY_STR = f"{_CURRENT_PY_STR}.{sys.version_info.micro}"
+
+
+# Check names, in bit order of EnvironmentChecker._check_bits
+_CHECK_NAMES = ("python_version", "packages", "tools", "directories")
+_ALL_PASS = (1 << len(_CHECK_NAMES)) - 1
+# Check indices from cheapest to most expensive, the fail_fast run order
+_FAIL_FAST_ORDER = (0, 3, 2, 1)
+
+# Report line prefixes
+_PASS = "✓ PASS - "
+_FAIL = "✗ FAIL - "
+
+
+def _safe_mtime(path: str) -> Optional[int]:
+    """Return a path's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a dotted version string such as "3.8" into a tuple of ints."""
+    return tuple(int(part) for part in version.split("."))
+
+
+class _EnvConfig(NamedTuple):
+    """Check settings, frozen from the component config at initialize."""
+    python_version: str
+    min_python: Tuple[int, ...]
+    required_packages: Tuple[str, ...]
+    required_tools: Tuple[str, ...]
+    directories: Tuple[str, ...]
+    fail_fast: bool
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_EnvConfig":
+        """Build the settings from a component config dictionary.
+        
+        Repeated entries are dropped, keeping the first occurrence. Tool
+        names are lowercased on Windows, where PATH lookups ignore case.
+        """
+        python_version = str(config.get("python_version", "3.8"))
+        tools = config.get("required_tools", ())
+        if sys.platform == "win32":
+            tools = [tool.lower() for tool in tools]
+        return cls(
+            python_version,
+            _parse_version(python_version),
+            tuple(dict.fromkeys(config.get("required_packages", ()))),
+            tuple(dict.fromkeys(tools)),
+            tuple(dict.fromkeys(config.get("directories", ()))),
+            bool(config.get("fail_fast", False)),
+        )
+
+
+def _list_dir(path: str) -> Dict[str, "os.DirEntry"]:
+    """List a directory once, keyed by entry name; empty if unreadable."""
+    try:
+        with os.scandir(path or os.curdir) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _path_index() -> Dict[str, str]:
+    """Scan every directory on PATH once.
+    
+    Returns:
+        Mapping of entry name to its path, keeping the first match in PATH
+        order. On Windows, names are lowercased and executables are also
+        indexed without their PATHEXT suffix.
+    """
+    windows = sys.platform == "win32"
+    pathext = [
+        ext.lower() for ext in os.environ.get("PATHEXT", "").split(os.pathsep) if ext
+    ] if windows else []
+    
+    index: Dict[str, str] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name.lower() if windows else entry.name
+                    index.setdefault(name, entry.path)
+                    for ext in pathext:
+                        if name.endswith(ext):
+                            index.setdefault(name[:-len(ext)], entry.path)
+        except OSError:
+            # Missing or unreadable PATH entries are skipped, like shutil.which
+            continue
+    return index
+
 
 class EnvironmentChecker(Component):
     """Automates environment checks and setup validation.
@@ -18,6 +120,8 @@ class EnvironmentChecker(Component):
     - Project directory structure
     """
 
+    __slots__ = ("_env", "_check_bits", "_ran_bits", "issues", "_cache_key", "_cached")
+
     def __init__(self, name: str = "environment", config: Optional[Dict[str, Any]] = None):
         """Initialize environment checker.
         
@@ -28,95 +132,227 @@ class EnvironmentChecker(Component):
                 - required_packages: List of required Python packages
                 - required_tools: List of required system tools
                 - directories: List of required directories
+                - fail_fast: Stop at the first failed check, running the
+                  checks from cheapest to most expensive (default False)
         """
         super().__init__(name, config)
-        self.checks_passed: Dict[str, bool] = {}
+        # Frozen copy of the check settings; built on first use
+        self._env: Optional[_EnvConfig] = None
+        # Bit i is set when check _CHECK_NAMES[i] passed; None until validated
+        self._check_bits: Optional[int] = None
+        # Bit i is set when check _CHECK_NAMES[i] ran
+        self._ran_bits = 0
         self.issues: List[str] = []
+        # Inputs and results of the last validate() run
+        self._cache_key: Optional[tuple] = None
+        self._cached: Optional[Tuple[int, int, List[str]]] = None
+
+    @property
+    def checks_passed(self) -> Dict[str, bool]:
+        """Result of each check run by the last validate() call."""
+        bits = self._check_bits
+        if bits is None:
+            return {}
+        ran = self._ran_bits
+        return {
+            name: bool(bits >> i & 1)
+            for i, name in enumerate(_CHECK_NAMES)
+            if ran >> i & 1
+        }
 
     def initialize(self) -> bool:
-        """Initialize the environment checker."""
+        """Initialize the environment checker.
+        
+        Freezes the check settings; later changes to ``config`` are not
+        picked up until ``initialize`` is called again.
+        """
+        self._env = _EnvConfig.from_config(self.config)
+        self.invalidate()
         self._initialized = True
         return True
 
     def validate(self) -> bool:
         """Validate the environment.
         
+        The result is reused while the config, PATH and the modification
+        times of the required directories are unchanged. Call
+        ``invalidate`` after installing packages or tools.
+        
+        With ``fail_fast`` set, the checks run one at a time from cheapest
+        to most expensive and validation stops at the first failure; only
+        the checks that ran appear in ``checks_passed``.
+        
         Returns:
             True if all checks pass, False otherwise
         """
-        self.checks_passed = {}
+        key = self._validation_key()
+        if key == self._cache_key:
+            self._check_bits, self._ran_bits, issues = self._cached
+            self.issues = list(issues)
+            return self._check_bits == _ALL_PASS
+
+        checks = (
+            self._check_python_version,
+            self._check_packages,
+            self._check_tools,
+            self._check_directories,
+        )
+        if self._env.fail_fast:
+            results = []
+            for i in _FAIL_FAST_ORDER:
+                result = checks[i]()
+                results.append((i, result))
+                if not result[0]:
+                    break
+        else:
+            # The python version check is cheap; the other checks wait on the
+            # import system and the filesystem, so they run concurrently
+            results = [(0, checks[0]())]
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [(i, executor.submit(checks[i])) for i in (1, 2, 3)]
+                results.extend((i, future.result()) for i, future in futures)
+
+        bits = ran = 0
         self.issues = []
+        for i, (passed, issues) in results:
+            bits |= passed << i
+            ran |= 1 << i
+            self.issues.extend(issues)
+        self._check_bits = bits
+        self._ran_bits = ran
 
-        # Check Python version
-        self.checks_passed["python_version"] = self._check_python_version()
-        
-        # Check required packages
-        self.checks_passed["packages"] = self._check_packages()
-        
-        # Check required tools
-        self.checks_passed["tools"] = self._check_tools()
-        
-        # Check directories
-        self.checks_passed["directories"] = self._check_directories()
+        self._cache_key = key
+        self._cached = (bits, ran, list(self.issues))
+        return bits == _ALL_PASS
+
+    def invalidate(self) -> None:
+        """Discard the cached validation result."""
+        self._cache_key = None
+        self._cached = None
+
+    def _settings(self) -> _EnvConfig:
+        """Return the frozen check settings, building them if needed."""
+        env = self._env
+        if env is None:
+            env = self._env = _EnvConfig.from_config(self.config)
+        return env
 
-        return all(self.checks_passed.values())
+    def _validation_key(self) -> tuple:
+        """Build the cache key for the inputs of the environment checks."""
+        env = self._settings()
+        return (
+            env,
+            os.environ.get("PATH"),
+            tuple(_safe_mtime(dir_path) for dir_path in env.directories),
+        )
 
-    def _check_python_version(self) -> bool:
-        """Check if Python version meets requirements."""
-        required = self.config.get("python_version", "3.8")
-        current = f"{sys.version_info.major}.{sys.version_info.minor}"
+    def _check_python_version(self) -> Tuple[bool, List[str]]:
+        """Check if Python version meets requirements.
         
-        required_parts = [int(x) for x in required.split(".")]
-        current_parts = [sys.version_info.major, sys.version_info.minor]
+        Returns:
+            Whether the check passed, and the issues found
+        """
+        env = self._settings()
         
-        if current_parts < required_parts:
-            self.issues.append(
-                f"Python version {current} is below required {required}"
-            )
-            return False
-        return True
+        if _CURRENT_PY < env.min_python:
+            return False, [
+                f"Python version {_CURRENT_PY_STR} is below required {env.python_version}"
+            ]
+        return True, []
 
-    def _check_packages(self) -> bool:
-        """Check if required packages are installed."""
-        required_packages = self.config.get("required_packages", [])
-        all_installed = True
+    def _check_packages(self) -> Tuple[bool, List[str]]:
+        """Check if required packages are installed.
+        
+        Returns:
+            Whether the check passed, and the issues found
+        """
+        loaded = sys.modules
+        issues = []
 
-        for package in required_packages:
+        for package in self._settings().required_packages:
+            # Already imported; a None entry marks an import that is blocked
+            if loaded.get(package) is not None:
+                continue
+            # Locate the package without executing it
             try:
-                __import__(package)
-            except ImportError:
-                self.issues.append(f"Required package not installed: {package}")
-                all_installed = False
+                spec = importlib.util.find_spec(package)
+            except (ImportError, ValueError):
+                # Missing parent package of a dotted name, or a malformed name
+                spec = None
+            if spec is None:
+                issues.append(f"Required package not installed: {package}")
+
+        return not issues, issues
 
-        return all_installed
+    def _check_tools(self) -> Tuple[bool, List[str]]:
+        """Check if required system tools are available.
+        
+        Returns:
+            Whether the check passed, and the issues found
+        """
+        required_tools = self._settings().required_tools
+        if not required_tools:
+            return True, []
+        import shutil
 
-    def _check_tools(self) -> bool:
-        """Check if required system tools are available."""
-        required_tools = self.config.get("required_tools", [])
-        all_available = True
+        issues = []
+        index = _path_index()
 
         for tool in required_tools:
-            if not shutil.which(tool):
-                self.issues.append(f"Required tool not found: {tool}")
-                all_available = False
+            if os.path.dirname(tool):
+                found = shutil.which(tool) is not None
+            else:
+                candidate = index.get(tool)
+                found = candidate is not None and (
+                    (os.access(candidate, os.X_OK) and not os.path.isdir(candidate))
+                    # The first match is not executable; a later one may be
+                    or shutil.which(tool) is not None
+                )
+            if not found:
+                issues.append(f"Required tool not found: {tool}")
+
+        return not issues, issues
 
-        return all_available
+    def _check_directories(self) -> Tuple[bool, List[str]]:
+        """Check if required directories exist.
+        
+        Returns:
+            Whether the check passed, and the issues found
+        """
+        required_dirs = self._settings().directories
+        issues = []
 
-    def _check_directories(self) -> bool:
-        """Check if required directories exist."""
-        required_dirs = self.config.get("directories", [])
-        all_exist = True
+        # Directories sharing a parent are answered from one listing of the
+        # parent, whose entries already carry their file type
+        siblings: Dict[str, int] = {}
+        for dir_path in required_dirs:
+            parent, name = os.path.split(dir_path)
+            if name not in ("", os.curdir, os.pardir):
+                siblings[parent] = siblings.get(parent, 0) + 1
+        listings = {
+            parent: _list_dir(parent)
+            for parent, count in siblings.items()
+            if count > 1
+        }
 
         for dir_path in required_dirs:
-            path = Path(dir_path)
-            if not path.exists():
-                self.issues.append(f"Required directory not found: {dir_path}")
-                all_exist = False
-            elif not path.is_dir():
-                self.issues.append(f"Path is not a directory: {dir_path}")
-                all_exist = False
+            parent, name = os.path.split(dir_path)
+            entry = listings[parent].get(name) if parent in listings else None
+            if entry is not None and not entry.is_symlink():
+                is_dir = entry.is_dir(follow_symlinks=False)
+            else:
+                # Not listed (or a symlink): one stat call answers both
+                # "exists" and "is a directory"
+                try:
+                    st = os.stat(dir_path)
+                except OSError:
+                    issues.append(f"Required directory not found: {dir_path}")
+                    continue
+                is_dir = stat.S_ISDIR(st.st_mode)
+            if not is_dir:
+                issues.append(f"Path is not a directory: {dir_path}")
 
-        return all_exist
+        return not issues, issues
 
     def auto_fix(self) -> Dict[str, bool]:
         """Attempt to automatically fix environment issues.
@@ -126,28 +362,47 @@ class EnvironmentChecker(Component):
         """
         fixes = {}
 
-        # Create missing directories
-        required_dirs = self.config.get("directories", [])
-        for dir_path in required_dirs:
-            path = Path(dir_path)
-            if not path.exists():
-                try:
-                    path.mkdir(parents=True, exist_ok=True)
-                    fixes[f"create_dir_{dir_path}"] = True
-                except Exception as e:
-                    fixes[f"create_dir_{dir_path}"] = False
-                    self.issues.append(f"Failed to create directory {dir_path}: {e}")
+        # Directories known to exist, so a parent shared by several
+        # required directories is checked and created only once
+        present = set()
+        for dir_path in self._settings().directories:
+            if os.path.exists(dir_path):
+                continue
+            # Walk up to the nearest existing ancestor, then create downwards
+            missing = []
+            path = os.path.normpath(dir_path)
+            while path and path not in present and not os.path.isdir(path):
+                missing.append(path)
+                parent = os.path.dirname(path)
+                if parent == path:
+                    break
+                path = parent
+            try:
+                for path in reversed(missing):
+                    try:
+                        os.mkdir(path)
+                    except FileExistsError:
+                        # Created concurrently, which is fine for a directory
+                        if not os.path.isdir(path):
+                            raise
+                    present.add(path)
+                fixes[f"create_dir_{dir_path}"] = True
+            except OSError as e:
+                fixes[f"create_dir_{dir_path}"] = False
+                self.issues.append(f"Failed to create directory {dir_path}: {e}")
 
+        if fixes:
+            self.invalidate()
         return fixes
 
     def get_status(self) -> Dict[str, Any]:
         """Get current environment status."""
         return {
-            "enabled": self.is_enabled(),
-            "initialized": self.is_initialized(),
+            "enabled": self._enabled,
+            "initialized": self._initialized,
             "checks_passed": self.checks_passed,
             "issues": self.issues,
-            "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+            "python_version": _FULL_PY_STR,
         }
 
     def get_report(self) -> str:
@@ -157,15 +412,14 @@ class EnvironmentChecker(Component):
             Formatted report string
         """
         lines = ["Environment Check Report", "=" * 40]
-        
-        for check_name, passed in self.checks_passed.items():
-            status = "✓ PASS" if passed else "✗ FAIL"
-            lines.append(f"{status} - {check_name}")
+        lines.extend(
+            (_PASS if passed else _FAIL) + check_name
+            for check_name, passed in self.checks_passed.items()
+        )
         
         if self.issues:
             lines.append("\nIssues Found:")
-            for issue in self.issues:
-                lines.append(f"  - {issue}")
+            lines.extend("  - " + issue for issue in self.issues)
         else:
             lines.append("\nNo issues found!")
         
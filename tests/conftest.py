@@ -0,0 +1,51 @@
+"""Shared test fixtures."""
+import pytest
+from aidevelopertool.context.manager import ContextManager
+from aidevelopertool.feedback.tracker import FeedbackTracker
+from aidevelopertool.setup.environment import EnvironmentChecker
+
+
+@pytest.fixture(scope="session")
+def _context_dir(tmp_path_factory):
+    """Storage directory shared by all ctx_mgr fixtures."""
+    return tmp_path_factory.mktemp("context")
+
+
+@pytest.fixture(scope="session")
+def _feedback_dir(tmp_path_factory):
+    """Log directory shared by all feedback_tracker fixtures."""
+    return tmp_path_factory.mktemp("logs")
+
+
+@pytest.fixture
+def ctx_mgr(_context_dir):
+    """In-memory context manager (no auto-save) on a shared directory."""
+    mgr = ContextManager(config={
+        "storage_dir": str(_context_dir),
+        "auto_save": False
+    })
+    mgr.initialize()
+    yield mgr
+    mgr.clear()
+
+
+@pytest.fixture
+def feedback_tracker(_feedback_dir):
+    """Quiet feedback tracker without an event log on a shared directory."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(_feedback_dir),
+        "enable_console": False,
+        "event_log": False
+    })
+    tracker.initialize()
+    yield tracker
+    tracker.clear()
+
+
+@pytest.fixture(scope="module")
+def base_checker():
+    """Default environment checker, validated once per module; treat as read-only."""
+    checker = EnvironmentChecker()
+    checker.initialize()
+    checker.validate()
+    return checker
@@ -1,4 +1,6 @@
 """Tests for context manager."""
+import json
+import threading
 import pytest
 from pathlib import Path
 from aidevelopertool.context.manager import ContextManager
@@ -13,16 +15,10 @@ def test_context_manager_creation(tmp_path):
     assert mgr.initialize()
 
 
-def test_create_context(tmp_path):
+def test_create_context(ctx_mgr):
     """Test creating a new context."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
-    
-    mgr.create_context("test_context", {"key": "value"})
-    context = mgr.get_context("test_context")
+    ctx_mgr.create_context("test_context", {"key": "value"})
+    context = ctx_mgr.get_context("test_context")
     
     assert context is not None
     assert context["data"]["key"] == "value"
@@ -30,52 +26,38 @@ def test_create_context(tmp_path):
     assert "created_at" in context
 
 
-def test_update_context(tmp_path):
+def test_update_context(ctx_mgr):
     """Test updating context."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
-    
-    mgr.create_context("test", {"key1": "value1"})
-    mgr.update_context("test", {"key2": "value2"})
+    ctx_mgr.create_context("test", {"key1": "value1"})
+    ctx_mgr.update_context("test", {"key2": "value2"})
     
-    context = mgr.get_context("test")
+    context = ctx_mgr.get_context("test")
     assert context["data"]["key1"] == "value1"
     assert context["data"]["key2"] == "value2"
     assert context["version"] == 2
+    
+    entry = ctx_mgr.context_history[-1]
+    assert entry["timestamp"] == context["updated_at"]
+    assert entry["changes"] == ["key2"]
 
 
-def test_delete_context(tmp_path):
+def test_delete_context(ctx_mgr):
     """Test deleting context."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
+    ctx_mgr.create_context("test", {"key": "value"})
+    assert ctx_mgr.get_context("test") is not None
     
-    mgr.create_context("test", {"key": "value"})
-    assert mgr.get_context("test") is not None
-    
-    assert mgr.delete_context("test")
-    assert mgr.get_context("test") is None
+    assert ctx_mgr.delete_context("test")
+    assert ctx_mgr.get_context("test") is None
 
 
-def test_share_between_contexts(tmp_path):
+def test_share_between_contexts(ctx_mgr):
     """Test sharing data between contexts."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
-    
-    mgr.create_context("source", {"shared_key": "shared_value", "other_key": "other"})
-    mgr.create_context("target", {"existing_key": "existing"})
+    ctx_mgr.create_context("source", {"shared_key": "shared_value", "other_key": "other"})
+    ctx_mgr.create_context("target", {"existing_key": "existing"})
     
-    assert mgr.share_between_contexts("source", "target", ["shared_key"])
+    assert ctx_mgr.share_between_contexts("source", "target", ["shared_key"])
     
-    target = mgr.get_context("target")
+    target = ctx_mgr.get_context("target")
     assert target["data"]["shared_key"] == "shared_value"
     assert target["data"]["existing_key"] == "existing"
     assert "other_key" not in target["data"]
@@ -108,35 +90,23 @@ def test_save_and_load_context(tmp_path):
     assert context["data"]["key"] == "value"
 
 
-def test_temp_context(tmp_path):
+def test_temp_context(ctx_mgr):
     """Test temporary context."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
-    
-    with mgr.temp_context("temp") as ctx:
+    with ctx_mgr.temp_context("temp") as ctx:
         ctx["temp_data"] = "temp_value"
-        assert mgr.get_context("temp") is not None
+        assert ctx_mgr.get_context("temp") is not None
     
     # Should be deleted after context manager exits
-    assert mgr.get_context("temp") is None
+    assert ctx_mgr.get_context("temp") is None
 
 
-def test_list_contexts(tmp_path):
+def test_list_contexts(ctx_mgr):
     """Test listing contexts."""
-    mgr = ContextManager(config={
-        "storage_dir": str(tmp_path / "context"),
-        "auto_save": False
-    })
-    mgr.initialize()
+    ctx_mgr.create_context("ctx1", {})
+    ctx_mgr.create_context("ctx2", {})
+    ctx_mgr.create_context("ctx3", {})
     
-    mgr.create_context("ctx1", {})
-    mgr.create_context("ctx2", {})
-    mgr.create_context("ctx3", {})
-    
-    contexts = mgr.list_contexts()
+    contexts = ctx_mgr.list_contexts()
     assert len(contexts) == 3
     assert "ctx1" in contexts
     assert "ctx2" in contexts
@@ -159,3 +129,237 @@ def test_status_reporting(tmp_path):
     assert status["contexts_count"] == 1
     assert status["auto_save"]
     assert "test" in status["contexts"]
+
+
+def test_save_context_is_atomic(tmp_path):
+    """Test that saving replaces the context file without leftovers."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": False
+    })
+    mgr.initialize()
+    
+    mgr.create_context("test", {"key": "value"})
+    mgr.save_context("test")
+    mgr.update_context("test", {"key": "updated"})
+    mgr.save_context("test")
+    
+    assert [p.name for p in storage_dir.iterdir()] == ["test.json"]
+    
+    mgr2 = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": False
+    })
+    assert mgr2.load_context("test")
+    assert mgr2.get_context("test")["data"]["key"] == "updated"
+
+
+def test_auto_save_coalesces_writes(tmp_path):
+    """Test that auto-save batches updates until the next flush."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": True,
+        "flush_interval": 3600
+    })
+    mgr.initialize()
+    
+    mgr.create_context("test", {"count": 0})
+    for i in range(1, 10):
+        mgr.update_context("test", {"count": i})
+    
+    # First write goes through immediately, later ones wait for a flush
+    snapshot = json.loads((storage_dir / "test.json").read_text())
+    assert snapshot["data"]["count"] == 0
+    
+    mgr.cleanup()
+    snapshot = json.loads((storage_dir / "test.json").read_text())
+    assert snapshot["data"]["count"] == 9
+
+
+def test_change_log_replay(tmp_path):
+    """Test that logged updates are replayed on top of the snapshot."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": True,
+        "snapshot_interval": 4
+    })
+    mgr.initialize()
+    
+    mgr.create_context("test", {"count": 0, "keep": True})
+    mgr.update_context("test", {"count": 1})
+    mgr.update_context("test", {"count": 2})
+    
+    assert (storage_dir / "test.log").exists()
+    
+    mgr2 = ContextManager(config={"storage_dir": str(storage_dir), "auto_save": False})
+    assert mgr2.load_context("test")
+    context = mgr2.get_context("test")
+    assert context["data"] == {"count": 2, "keep": True}
+    assert context["version"] == 3
+    
+    # A snapshot supersedes the log
+    mgr.update_context("test", {"count": 3})
+    mgr.flush()
+    assert not (storage_dir / "test.log").exists()
+    
+    mgr.cleanup()
+    assert mgr2.load_context("test")
+    assert mgr2.get_context("test")["data"]["count"] == 3
+
+
+def test_msgpack_storage_format(tmp_path):
+    """Test saving and loading contexts as msgpack snapshots."""
+    pytest.importorskip("msgpack")
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": False,
+        "storage_format": "msgpack"
+    })
+    mgr.initialize()
+    
+    mgr.create_context("test", {"key": "value", "count": 3})
+    mgr.save_context("test")
+    assert (storage_dir / "test.msgpack").exists()
+    
+    # Readers configured for JSON still find msgpack snapshots
+    mgr2 = ContextManager(config={"storage_dir": str(storage_dir), "auto_save": False})
+    mgr2.initialize()
+    assert mgr2.load_context("test")
+    assert mgr2.get_context("test")["data"] == {"key": "value", "count": 3}
+    
+    assert mgr.delete_context("test")
+    assert not (storage_dir / "test.msgpack").exists()
+
+
+def test_status_contexts_track_changes(ctx_mgr):
+    """Test that status reflects contexts added and removed between calls."""
+    ctx_mgr.create_context("a", {})
+    first = ctx_mgr.get_status()["contexts"]
+    assert first == ["a"]
+    
+    # Callers get their own list
+    first.append("x")
+    ctx_mgr.create_context("b", {})
+    assert ctx_mgr.get_status()["contexts"] == ["a", "b"]
+    
+    ctx_mgr.delete_context("a")
+    assert ctx_mgr.get_status()["contexts"] == ["b"]
+
+
+def test_history_is_bounded(tmp_path):
+    """Test that context history keeps only the most recent entries."""
+    mgr = ContextManager(config={
+        "storage_dir": str(tmp_path / "context"),
+        "auto_save": False,
+        "history_max": 3
+    })
+    mgr.initialize()
+    
+    mgr.create_context("test", {})
+    for i in range(5):
+        mgr.update_context("test", {"count": i})
+    
+    assert mgr.get_status()["history_count"] == 3
+    assert [entry["version"] for entry in mgr.context_history] == [4, 5, 6]
+
+
+def test_clear_keeps_saved_files(ctx_mgr):
+    """Test that clear drops in-memory contexts but not saved ones."""
+    ctx_mgr.create_context("saved", {"key": "value"})
+    ctx_mgr.save_context("saved")
+    ctx_mgr.create_context("unsaved", {})
+    
+    ctx_mgr.clear()
+    assert ctx_mgr.list_contexts() == []
+    assert len(ctx_mgr.context_history) == 0
+    
+    assert ctx_mgr.load_context("saved")
+    assert not ctx_mgr.load_context("unsaved")
+    ctx_mgr.delete_context("saved")
+
+
+def test_load_context_without_snapshot(tmp_path):
+    """Test that a context created between flushes is rebuilt from its log."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={
+        "storage_dir": str(storage_dir),
+        "auto_save": True,
+        "flush_interval": 3600
+    })
+    mgr.initialize()
+    
+    mgr.create_context("a", {"x": 1})
+    mgr.create_context("b", {"y": 0, "keep": True})
+    # Recreating replaces the snapshotted context
+    mgr.create_context("a", {"x": 2})
+    for i in range(1, 11):
+        mgr.update_context("b", {"y": i})
+    assert not (storage_dir / "b.json").exists()
+    
+    mgr2 = ContextManager(config={"storage_dir": str(storage_dir), "auto_save": False})
+    assert mgr2.load_context("b")
+    context = mgr2.get_context("b")
+    assert context["data"] == {"y": 10, "keep": True}
+    assert context["version"] == 11
+    assert context["created_at"] == mgr.get_context("b")["created_at"]
+    assert mgr2.load_context("a")
+    assert mgr2.get_context("a")["data"] == {"x": 2}
+    assert not mgr2.load_context("missing")
+    assert "missing" not in mgr2.list_contexts()
+
+
+def test_concurrent_auto_save(tmp_path):
+    """Test that contexts can be created and updated from several threads."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={"storage_dir": str(storage_dir), "flush_interval": 0})
+    mgr.initialize()
+    errors = []
+    
+    def worker(n):
+        try:
+            for i in range(50):
+                context_id = f"ctx-{n}-{i % 5}"
+                mgr.create_context(context_id, {"i": i})
+                mgr.update_context(context_id, {"j": i})
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    mgr.cleanup()
+    
+    assert errors == []
+    mgr2 = ContextManager(config={"storage_dir": str(storage_dir), "auto_save": False})
+    assert mgr2.load_context("ctx-3-4")
+    assert mgr2.get_context("ctx-3-4")["data"] == {"i": 49, "j": 49}
+
+
+def test_concurrent_updates_reload_from_log(tmp_path):
+    """Test that concurrent updates are all recovered from the change log."""
+    storage_dir = tmp_path / "context"
+    mgr = ContextManager(config={"storage_dir": str(storage_dir), "flush_interval": 3600})
+    mgr.initialize()
+    mgr.create_context("shared", {})
+    
+    def worker(n):
+        for i in range(500):
+            mgr.update_context("shared", {f"{n}-{i}": i})
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # Reload without cleanup(), from the snapshot and the change log only
+    mgr2 = ContextManager(config={"storage_dir": str(storage_dir), "auto_save": False})
+    assert mgr2.load_context("shared")
+    assert mgr2.get_context("shared")["version"] == 2001
+    assert mgr2.get_context("shared")["data"] == mgr.get_context("shared")["data"]
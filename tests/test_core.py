@@ -1,8 +1,10 @@
 """Tests for core components."""
+import threading
 import pytest
 from pathlib import Path
-from aidevelopertool.core.component import Component
+from aidevelopertool.core.component import Component, ComponentProtocol
 from aidevelopertool.core.project import AIProject
+from aidevelopertool.feedback.tracker import FeedbackTracker
 
 
 class MockComponent(Component):
@@ -71,6 +73,18 @@ def test_aiproject_add_component():
     assert project.get_component("comp2") == comp2
 
 
+def test_aiproject_components_argument():
+    """Test registering components when creating the project."""
+    comp1 = MockComponent("comp1")
+    comp2 = MockComponent("comp2")
+    project = AIProject("test-project", components=[comp1, comp2])
+    
+    assert project.get_component("comp1") is comp1
+    assert project.get_component("comp2") is comp2
+    assert project.initialize()
+    assert project.validate() == {"comp1": True, "comp2": True}
+
+
 def test_aiproject_remove_component():
     """Test removing components from project."""
     project = AIProject("test-project")
@@ -144,12 +158,126 @@ def test_aiproject_config_save_load(tmp_path):
     assert loaded_project.project_dir == tmp_path
 
 
+def test_aiproject_component_configs_load_lazily(tmp_path):
+    """Test that component configs are stored separately and read on demand."""
+    config_path = tmp_path / "ai_project.yaml"
+    project = AIProject("test-project", tmp_path)
+    project.add_component(MockComponent("mock", {"setting": "value"}))
+    tracker = FeedbackTracker("feedback", {"log_dir": str(tmp_path / "logs")})
+    tracker.disable()
+    project.add_component(tracker)
+    project.save_config(config_path)
+    
+    assert (tmp_path / "components" / "mock.yaml").exists()
+    assert (tmp_path / "components" / "feedback.yaml").exists()
+    
+    loaded = AIProject.load_config(config_path)
+    assert loaded.components == {}
+    assert loaded.get_component_config("mock")["config"] == {"setting": "value"}
+    # Custom component types cannot be rebuilt from config
+    assert loaded.get_component("mock") is None
+    
+    feedback = loaded.get_component("feedback")
+    assert isinstance(feedback, FeedbackTracker)
+    assert feedback.config["log_dir"] == str(tmp_path / "logs")
+    assert not feedback.is_enabled()
+    assert loaded.get_component("feedback") is feedback
+    
+    # Saving again keeps components that were never materialized
+    loaded.save_config(config_path)
+    reloaded = AIProject.load_config(config_path)
+    assert reloaded.get_component_config("mock")["type"] == "MockComponent"
+
+
+def test_aiproject_load_inline_component_config(tmp_path):
+    """Test loading a config file with component configs inline."""
+    config_path = tmp_path / "ai_project.yaml"
+    config_path.write_text(
+        "project:\n"
+        "  name: legacy\n"
+        "components:\n"
+        "  pipeline:\n"
+        "    type: PipelineManager\n"
+        "    config: {max_workers: 2}\n"
+        "    enabled: true\n"
+    )
+    
+    project = AIProject.load_config(config_path)
+    assert project.name == "legacy"
+    assert project.get_component("pipeline").config == {"max_workers": 2}
+
+
+def test_aiproject_config_round_trip_keeps_values(tmp_path):
+    """Test that saved config values load back unchanged."""
+    config_path = tmp_path / "ai_project.yaml"
+    settings = {"mode": "0o755", "scale": "1e3", "flag": "no", "enabled": False}
+    project = AIProject("test-project", tmp_path)
+    project.add_component(MockComponent("mock", settings))
+    project.save_config(config_path)
+    
+    loaded = AIProject.load_config(config_path)
+    assert loaded.get_component_config("mock")["config"] == settings
+    
+    (tmp_path / "components" / "mock.yaml").write_text(
+        "type: MockComponent\nconfig: {}\nenabled: off\n"
+    )
+    assert AIProject.load_config(config_path).get_component_config("mock")["enabled"] is False
+
+
+def test_aiproject_component_file_names(tmp_path):
+    """Test component names that are not plain file names, and missing files."""
+    config_path = tmp_path / "ai_project.yaml"
+    project = AIProject("test-project", tmp_path)
+    project.add_component(MockComponent("team/ctx", {"setting": "value"}))
+    project.add_component(MockComponent("gone"))
+    project.save_config(config_path)
+    
+    assert (tmp_path / "components" / "team%2Fctx.yaml").exists()
+    (tmp_path / "components" / "gone.yaml").unlink()
+    
+    loaded = AIProject.load_config(config_path)
+    assert loaded.get_component_config("team/ctx")["config"] == {"setting": "value"}
+    assert loaded.get_component_config("gone") == {}
+    assert loaded.get_component("gone") is None
+
+
 def test_aiproject_cleanup():
     """Test project cleanup."""
-    project = AIProject("test-project")
-    comp = MockComponent("comp")
-    project.add_component(comp)
+    project = AIProject("test-project", components=[MockComponent("comp")])
     project.initialize()
     
     # Should not raise any errors
     project.cleanup()
+
+
+def test_component_protocol():
+    """Test structural component checks and validation dispatch."""
+    comp = MockComponent("comp")
+    assert isinstance(comp, ComponentProtocol)
+    assert not isinstance(object(), ComponentProtocol)
+    
+    project = AIProject("test-project")
+    project.add_component(comp)
+    assert project.validate() == {"comp": False}
+    comp.initialize()
+    assert project.validate() == {"comp": True}
+    
+    project.remove_component("comp")
+    assert project.validate() == {}
+
+
+def test_aiproject_serial_initialization():
+    """Test initializing components in order on the calling thread."""
+    order = []
+    
+    class RecordingComponent(MockComponent):
+        def initialize(self) -> bool:
+            order.append((self.name, threading.current_thread()))
+            return super().initialize()
+    
+    project = AIProject("test-project", parallel_init=False)
+    for name in ("a", "b", "c"):
+        project.add_component(RecordingComponent(name))
+    
+    assert project.initialize()
+    assert order == [(name, threading.current_thread()) for name in ("a", "b", "c")]
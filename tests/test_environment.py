@@ -1,4 +1,6 @@
 """Tests for environment checker."""
+import importlib.util
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -37,6 +39,18 @@ def test_package_check():
     assert checker.checks_passed.get("packages")
 
 
+def test_missing_package_check():
+    """Test that missing packages are reported without importing."""
+    checker = EnvironmentChecker(config={
+        "required_packages": ["json", "no_such_package_xyz", "no_such_parent.child"]
+    })
+    assert not checker.validate()
+    assert checker.issues == [
+        "Required package not installed: no_such_package_xyz",
+        "Required package not installed: no_such_parent.child",
+    ]
+
+
 def test_directory_check(tmp_path):
     """Test directory existence check."""
     test_dir = tmp_path / "test_directory"
@@ -83,25 +97,223 @@ def test_auto_fix_directories(tmp_path):
     assert missing_dir.exists()
 
 
-def test_status_report():
+def test_status_report(base_checker):
     """Test status reporting."""
-    checker = EnvironmentChecker()
-    checker.initialize()
-    checker.validate()
-    
-    status = checker.get_status()
+    status = base_checker.get_status()
     assert "enabled" in status
     assert "initialized" in status
     assert "checks_passed" in status
-    assert "python_version" in status
+    assert status["python_version"] == "{}.{}.{}".format(*sys.version_info[:3])
+    assert status["initialized"] and status["enabled"]
 
 
-def test_human_readable_report():
+def test_human_readable_report(base_checker):
     """Test human-readable report generation."""
-    checker = EnvironmentChecker()
-    checker.initialize()
-    checker.validate()
-    
-    report = checker.get_report()
+    report = base_checker.get_report()
     assert "Environment Check Report" in report
     assert "python_version" in report
+    assert "✓ PASS - python_version" in report
+    assert "No issues found!" in report
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX executable bits")
+def test_tool_check(tmp_path, monkeypatch):
+    """Test required tool lookup on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "mytool"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    (bin_dir / "notexec").write_text("")
+    monkeypatch.setenv("PATH", os.pathsep.join([str(tmp_path / "missing"), str(bin_dir)]))
+    
+    checker = EnvironmentChecker(config={"required_tools": ["mytool"]})
+    assert checker.validate()
+    
+    checker = EnvironmentChecker(config={"required_tools": ["mytool", "notexec", "nope"]})
+    assert not checker.validate()
+    assert checker.issues == [
+        "Required tool not found: notexec",
+        "Required tool not found: nope",
+    ]
+
+
+def test_python_version_too_old():
+    """Test that a newer required Python version fails the check."""
+    required = f"{sys.version_info.major}.{sys.version_info.minor + 1}"
+    
+    checker = EnvironmentChecker(config={"python_version": required})
+    assert not checker.validate()
+    assert not checker.checks_passed["python_version"]
+    assert checker.issues[0].endswith(f"is below required {required}")
+
+
+def test_validate_reuses_result_until_inputs_change(tmp_path, monkeypatch):
+    """Test that validation is cached until the environment changes."""
+    calls = []
+    find_spec = importlib.util.find_spec
+    
+    def counting_find_spec(name, *args):
+        calls.append(name)
+        return find_spec(name, *args)
+    
+    monkeypatch.setattr(importlib.util, "find_spec", counting_find_spec)
+    (tmp_path / "envcheck_probe.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    data_dir = tmp_path / "data"
+    checker = EnvironmentChecker(config={
+        "required_packages": ["envcheck_probe"],
+        "directories": [str(data_dir)]
+    })
+    
+    assert not checker.validate()
+    assert not checker.validate()
+    assert calls == ["envcheck_probe"]
+    
+    data_dir.mkdir()
+    assert checker.validate()
+    assert calls == ["envcheck_probe", "envcheck_probe"]
+    
+    checker.invalidate()
+    assert checker.validate()
+    assert len(calls) == 3
+
+
+def test_directory_check_rejects_files(tmp_path):
+    """Test that a file where a directory is required is reported."""
+    not_a_dir = tmp_path / "file.txt"
+    not_a_dir.write_text("")
+    
+    checker = EnvironmentChecker(config={"directories": [str(not_a_dir)]})
+    assert not checker.validate()
+    assert checker.issues == [f"Path is not a directory: {not_a_dir}"]
+
+
+def test_checks_passed_reports_each_check(tmp_path):
+    """Test per-check results before and after validation."""
+    checker = EnvironmentChecker(config={"directories": [str(tmp_path / "missing")]})
+    assert checker.checks_passed == {}
+    
+    checker.validate()
+    assert checker.checks_passed == {
+        "python_version": True,
+        "packages": True,
+        "tools": True,
+        "directories": False,
+    }
+
+
+def test_validate_cached_result_on_shared_checker(base_checker):
+    """Test that revalidating an unchanged environment reuses the result."""
+    issues = base_checker.issues
+    assert base_checker.validate()
+    assert base_checker.issues == issues
+    assert base_checker.checks_passed == dict.fromkeys(base_checker.checks_passed, True)
+
+
+def test_initialize_freezes_settings(tmp_path):
+    """Test that config changes apply only after initialize is called again."""
+    checker = EnvironmentChecker(config={"directories": []})
+    checker.initialize()
+    checker.config["directories"] = [str(tmp_path / "missing")]
+    assert checker.validate()
+    
+    checker.initialize()
+    assert not checker.validate()
+    assert not checker.checks_passed["directories"]
+
+
+def test_fail_fast_stops_at_first_failure(tmp_path, monkeypatch):
+    """Test that fail_fast skips the remaining, more expensive checks."""
+    calls = []
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name, *args: calls.append(name))
+    checker = EnvironmentChecker(config={
+        "fail_fast": True,
+        "required_packages": ["json"],
+        "directories": [str(tmp_path / "missing")],
+    })
+    
+    assert not checker.validate()
+    assert calls == []
+    assert checker.checks_passed == {"python_version": True, "directories": False}
+    assert checker.issues == [f"Required directory not found: {tmp_path / 'missing'}"]
+    assert "packages" not in checker.get_report()
+
+
+def test_sibling_directories_check(tmp_path):
+    """Test directories under one parent, including files and symlinks."""
+    for name in ("data", "models", "logs"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "notes.txt").write_text("")
+    paths = [str(tmp_path / name) for name in ("data", "models", "notes.txt", "cache")]
+    if sys.platform != "win32":
+        os.symlink(tmp_path / "logs", tmp_path / "link")
+        os.symlink(tmp_path / "gone", tmp_path / "broken")
+        paths += [str(tmp_path / "link"), str(tmp_path / "broken")]
+    
+    checker = EnvironmentChecker(config={"directories": paths})
+    assert not checker.validate()
+    expected = [
+        f"Path is not a directory: {tmp_path / 'notes.txt'}",
+        f"Required directory not found: {tmp_path / 'cache'}",
+    ]
+    if sys.platform != "win32":
+        expected.append(f"Required directory not found: {tmp_path / 'broken'}")
+    assert checker.issues == expected
+
+
+def test_package_check_uses_loaded_modules(monkeypatch):
+    """Test that imported modules are found without a finder lookup."""
+    calls = []
+    find_spec = importlib.util.find_spec
+    
+    def counting_find_spec(name, *args):
+        calls.append(name)
+        return find_spec(name, *args)
+    
+    monkeypatch.setattr(importlib.util, "find_spec", counting_find_spec)
+    monkeypatch.setitem(sys.modules, "blocked_module_xyz", None)
+    
+    checker = EnvironmentChecker(config={"required_packages": ["sys", "blocked_module_xyz"]})
+    assert not checker.validate()
+    assert calls == ["blocked_module_xyz"]
+    assert checker.issues == ["Required package not installed: blocked_module_xyz"]
+
+
+def test_duplicate_entries_checked_once(tmp_path):
+    """Test that repeated config entries are checked and reported once."""
+    missing = str(tmp_path / "missing")
+    checker = EnvironmentChecker(config={
+        "required_packages": ["no_such_package_xyz", "no_such_package_xyz"],
+        "directories": [missing, missing],
+    })
+    assert not checker.validate()
+    assert checker.issues == [
+        "Required package not installed: no_such_package_xyz",
+        f"Required directory not found: {missing}",
+    ]
+
+
+def test_auto_fix_creates_shared_parents_once(tmp_path, monkeypatch):
+    """Test that auto-fix creates each missing directory exactly once."""
+    created = []
+    mkdir = os.mkdir
+    monkeypatch.setattr(os, "mkdir", lambda path, *args: created.append(path) or mkdir(path, *args))
+    root = tmp_path / "project"
+    dirs = [str(root / "data" / "raw"), str(root / "data" / "processed"), str(root / "models")]
+    
+    checker = EnvironmentChecker(config={"directories": dirs})
+    fixes = checker.auto_fix()
+    assert fixes == {f"create_dir_{d}": True for d in dirs}
+    assert sorted(created) == sorted({str(root), str(root / "data"), *dirs})
+    assert checker.validate()
+
+
+def test_auto_fix_reports_blocked_directory(tmp_path):
+    """Test that a file in the way of a directory is reported as a failed fix."""
+    (tmp_path / "blocker").write_text("")
+    target = str(tmp_path / "blocker" / "child")
+    
+    checker = EnvironmentChecker(config={"directories": [target]})
+    assert checker.auto_fix() == {f"create_dir_{target}": False}
+    assert checker.issues[-1].startswith(f"Failed to create directory {target}: ")
@@ -1,4 +1,7 @@
 """Tests for feedback tracker."""
+import json
+import shutil
+import threading
 import pytest
 from pathlib import Path
 from aidevelopertool.feedback.tracker import FeedbackTracker, FeedbackLevel
@@ -13,77 +16,51 @@ def test_feedback_tracker_creation(tmp_path):
     assert tracker.initialize()
 
 
-def test_log_event(tmp_path):
+def test_log_event(feedback_tracker):
     """Test logging events."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.log_event("Test event", level="info", category="test")
-    assert len(tracker.events) == 1
-    assert tracker.events[0]["message"] == "Test event"
-    assert tracker.events[0]["level"] == "info"
+    feedback_tracker.log_event("Test event", level="info", category="test")
+    assert len(feedback_tracker.events) == 1
+    assert feedback_tracker.events[0]["message"] == "Test event"
+    assert feedback_tracker.events[0]["level"] == "info"
 
 
-def test_add_milestone(tmp_path):
+def test_add_milestone(feedback_tracker):
     """Test adding milestones."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.add_milestone("test_milestone", "Test description", completed=False)
-    assert len(tracker.milestones) == 1
-    assert tracker.milestones[0]["name"] == "test_milestone"
-    assert not tracker.milestones[0]["completed"]
+    feedback_tracker.add_milestone("test_milestone", "Test description", completed=False)
+    assert len(feedback_tracker.milestones) == 1
+    assert feedback_tracker.milestones["test_milestone"]["name"] == "test_milestone"
+    assert not feedback_tracker.milestones["test_milestone"]["completed"]
 
 
-def test_complete_milestone(tmp_path):
+def test_complete_milestone(feedback_tracker):
     """Test completing milestones."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.add_milestone("test", "Test milestone", completed=False)
-    assert tracker.complete_milestone("test")
-    assert tracker.milestones[0]["completed"]
-    assert tracker.milestones[0]["completed_at"] is not None
+    feedback_tracker.add_milestone("test", "Test milestone", completed=False)
+    assert feedback_tracker.complete_milestone("test")
+    assert feedback_tracker.milestones["test"]["completed"]
+    assert feedback_tracker.milestones["test"]["completed_at"] is not None
+    assert not feedback_tracker.complete_milestone("test")
+    assert not feedback_tracker.complete_milestone("missing")
 
 
-def test_update_metric(tmp_path):
+def test_update_metric(feedback_tracker):
     """Test updating metrics."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.update_metric("accuracy", 0.95)
-    assert "accuracy" in tracker.metrics
-    assert tracker.metrics["accuracy"]["value"] == 0.95
+    feedback_tracker.update_metric("accuracy", 0.95)
+    assert "accuracy" in feedback_tracker.metrics
+    assert feedback_tracker.metrics["accuracy"]["value"] == 0.95
+    summary = feedback_tracker.get_progress_summary()
+    assert "updated_at" in summary["metrics"]["accuracy"]
 
 
-def test_progress_summary(tmp_path):
+def test_progress_summary(feedback_tracker):
     """Test progress summary generation."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.add_milestone("m1", "Milestone 1", completed=True)
-    tracker.add_milestone("m2", "Milestone 2", completed=False)
-    tracker.add_milestone("m3", "Milestone 3", completed=True)
+    feedback_tracker.add_milestone("m1", "Milestone 1", completed=True)
+    feedback_tracker.add_milestone("m2", "Milestone 2", completed=False)
+    feedback_tracker.add_milestone("m3", "Milestone 3", completed=True)
     
-    summary = tracker.get_progress_summary()
+    summary = feedback_tracker.get_progress_summary()
     assert summary["milestones"]["total"] == 3
     assert summary["milestones"]["completed"] == 2
-    assert summary["milestones"]["percentage"] == pytest.approx(66.67, rel=0.1)
+    assert summary["milestones"]["percentage"] * 3 == 200
 
 
 def test_technical_feedback(tmp_path):
@@ -103,88 +80,289 @@ def test_technical_feedback(tmp_path):
     assert "all_milestones" in summary
 
 
-def test_executive_feedback(tmp_path):
+def test_executive_feedback(feedback_tracker):
     """Test executive-level feedback."""
-    tracker = FeedbackTracker(config={
-        "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
-    })
-    tracker.initialize()
-    
-    tracker.add_milestone(
+    feedback_tracker.add_milestone(
         "m1",
         "Important milestone",
         completed=True,
         metadata={"executive_visibility": True}
     )
     
-    summary = tracker.get_progress_summary(FeedbackLevel.EXECUTIVE)
+    summary = feedback_tracker.get_progress_summary(FeedbackLevel.EXECUTIVE)
     assert "key_milestones" in summary
 
 
-def test_creative_feedback(tmp_path):
+def test_creative_feedback(feedback_tracker):
     """Test creative-level feedback."""
+    feedback_tracker.add_milestone("m1", "Milestone 1", completed=True)
+    feedback_tracker.add_milestone("m2", "Milestone 2", completed=False)
+    
+    summary = feedback_tracker.get_progress_summary(FeedbackLevel.CREATIVE)
+    assert "story" in summary
+    assert "milestones achieved" in summary["story"]
+
+
+def test_explainable_status(feedback_tracker):
+    """Test explainable status."""
+    feedback_tracker.add_milestone("test_milestone", "Test description", completed=True)
+    
+    status = feedback_tracker.get_explainable_status("test_milestone")
+    assert status["type"] == "milestone"
+    assert status["status"] == "completed"
+    assert "explanation" in status
+
+
+def test_export_report(feedback_tracker):
+    """Test exporting feedback report."""
+    feedback_tracker.log_event("Test event", level="info")
+    feedback_tracker.add_milestone("m1", "Milestone", completed=True)
+    
+    report_path = feedback_tracker.export_report()
+    assert report_path.exists()
+    assert report_path.suffix == ".json"
+    
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["events"][0]["message"] == "Test event"
+    assert report["milestones"][0]["name"] == "m1"
+
+
+def test_listener(feedback_tracker):
+    """Test event listeners."""
+    events_received = []
+    
+    def listener(event):
+        events_received.append(event)
+    
+    feedback_tracker.add_listener(listener)
+    feedback_tracker.log_event("Test event", level="info")
+    
+    assert len(events_received) == 1
+    assert events_received[0]["message"] == "Test event"
+    assert events_received[0] == feedback_tracker.events[0].to_dict()
+    assert json.loads(json.dumps(events_received[0]))["level"] == "info"
+
+
+def test_background_listener(tmp_path):
+    """Test listeners called off the logging thread."""
     tracker = FeedbackTracker(config={
         "log_dir": str(tmp_path / "logs"),
         "enable_console": False
     })
+    
+    received = []
+    threads = set()
+    
+    def listener(event):
+        threads.add(threading.current_thread())
+        received.append(event["message"])
+    
+    tracker.add_listener(listener, background=True)
+    for i in range(3):
+        tracker.log_event(f"Event {i}")
+    tracker.cleanup()
+    
+    assert received == ["Event 0", "Event 1", "Event 2"]
+    assert threading.current_thread() not in threads
+
+
+def test_console_output_is_synchronous(tmp_path, capsys):
+    """Test that console output is printed in order with the caller's output."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(tmp_path / "logs"),
+        "enable_console": True
+    })
     tracker.initialize()
     
-    tracker.add_milestone("m1", "Milestone 1", completed=True)
-    tracker.add_milestone("m2", "Milestone 2", completed=False)
+    print("Before")
+    tracker.log_event("First event", level="info", category="test")
+    print("Between")
+    tracker.log_event("Second event", level="success", category="test")
     
-    summary = tracker.get_progress_summary(FeedbackLevel.CREATIVE)
-    assert "story" in summary
-    assert "milestones achieved" in summary["story"]
+    assert capsys.readouterr().out == (
+        "Before\nℹ [test] First event\nBetween\n✓ [test] Second event\n"
+    )
+    tracker.cleanup()
 
 
-def test_explainable_status(tmp_path):
-    """Test explainable status."""
+def test_event_record_access(feedback_tracker):
+    """Test that events support attribute and key access."""
+    feedback_tracker.log_event("Test event", level="warning", metadata={"k": 1}, category="data")
+    event = feedback_tracker.events[0]
+    
+    assert event.message == event["message"] == "Test event"
+    assert event.get("category") == "data"
+    assert event.get("missing") is None
+    with pytest.raises(KeyError):
+        event["missing"]
+    assert event.to_dict()["metadata"] == {"k": 1}
+    assert isinstance(event.timestamp_ns, int)
+    assert event["timestamp"] == event.to_dict()["timestamp"]
+
+
+def test_events_are_bounded(tmp_path):
+    """Test that only the most recent events are kept."""
     tracker = FeedbackTracker(config={
         "log_dir": str(tmp_path / "logs"),
-        "enable_console": False
+        "enable_console": False,
+        "max_events": 10
+    })
+    
+    for i in range(25):
+        tracker.log_event(f"Event {i}")
+    
+    assert len(tracker.events) == 10
+    assert tracker.events[0]["message"] == "Event 15"
+    recent = tracker.get_progress_summary()["recent_events"]
+    assert [e["message"] for e in recent] == [f"Event {i}" for i in range(20, 25)]
+
+
+def test_events_streamed_to_jsonl(tmp_path):
+    """Test that events are appended to the event log and exported."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(tmp_path / "logs"),
+        "enable_console": False,
+        "max_events": 2
     })
     tracker.initialize()
     
-    tracker.add_milestone("test_milestone", "Test description", completed=True)
+    for i in range(5):
+        tracker.log_event(f"Event {i}", metadata={"path": tmp_path})
     
-    status = tracker.get_explainable_status("test_milestone")
-    assert status["type"] == "milestone"
-    assert status["status"] == "completed"
-    assert "explanation" in status
+    export_path = tracker.export_events(tmp_path / "events.jsonl")
+    lines = export_path.read_text().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [f"Event {i}" for i in range(5)]
+    assert json.loads(lines[0])["metadata"]["path"] == str(tmp_path)
+    tracker.cleanup()
 
 
-def test_export_report(tmp_path):
-    """Test exporting feedback report."""
+def test_export_events_requires_event_log(tmp_path):
+    """Test exporting events when the event log is disabled."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(tmp_path / "logs"),
+        "enable_console": False,
+        "event_log": False
+    })
+    tracker.initialize()
+    
+    with pytest.raises(ValueError):
+        tracker.export_events()
+
+
+def test_completed_milestone_count(tmp_path):
+    """Test the completed count when milestones are completed or replaced."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(tmp_path / "logs"),
+        "enable_console": False
+    })
+    
+    tracker.add_milestone("m1", "First", completed=True)
+    tracker.add_milestone("m2", "Second")
+    tracker.complete_milestone("m2")
+    tracker.complete_milestone("m2")
+    assert tracker.get_progress_summary()["milestones"]["completed"] == 2
+    
+    # Re-adding a milestone replaces it
+    tracker.add_milestone("m1", "First again")
+    summary = tracker.get_progress_summary()["milestones"]
+    assert summary["total"] == 2
+    assert summary["completed"] == 1
+
+
+def test_event_level_and_category_are_interned(tmp_path):
+    """Test that events share level and category strings."""
     tracker = FeedbackTracker(config={
         "log_dir": str(tmp_path / "logs"),
         "enable_console": False
     })
+    
+    for i in range(2):
+        tracker.log_event("Event", level="".join(["warn", "ing"]), category="".join(["da", "ta"]))
+    
+    first, second = tracker.events
+    assert first.level is second.level
+    assert first.category is second.category
+
+
+def test_log_event_accepts_non_string_levels(tmp_path, capsys):
+    """Test that levels and categories that are not plain strings are kept as given."""
+    tracker = FeedbackTracker(config={"log_dir": str(tmp_path / "logs")})
     tracker.initialize()
     
-    tracker.log_event("Test event", level="info")
-    tracker.add_milestone("m1", "Milestone", completed=True)
+    tracker.log_event("Enum level", level=FeedbackLevel.EXECUTIVE)
+    tracker.log_event("No level", level=None, category=None)
+    tracker.cleanup()
     
-    report_path = tracker.export_report()
-    assert report_path.exists()
-    assert report_path.suffix == ".json"
+    assert tracker.events[0]["level"] is FeedbackLevel.EXECUTIVE
+    assert tracker.events[1]["category"] is None
+    assert "• [None] No level" in capsys.readouterr().out
+    assert len((tmp_path / "logs" / "events.jsonl").read_text().splitlines()) == 2
 
 
-def test_listener(tmp_path):
-    """Test event listeners."""
+def test_completed_milestone_timestamps_match(tmp_path):
+    """Test that a milestone added as completed shares one timestamp."""
     tracker = FeedbackTracker(config={
         "log_dir": str(tmp_path / "logs"),
         "enable_console": False
     })
+    
+    tracker.add_milestone("done", "Already done", completed=True)
+    milestone = tracker.milestones["done"]
+    assert milestone["created_at"] == milestone["completed_at"]
+
+
+def test_clear(feedback_tracker):
+    """Test forgetting recorded feedback."""
+    feedback_tracker.log_event("Event")
+    feedback_tracker.add_milestone("m1", "Milestone", completed=True)
+    feedback_tracker.update_metric("accuracy", 0.9)
+    
+    feedback_tracker.clear()
+    
+    summary = feedback_tracker.get_progress_summary()
+    assert summary["milestones"] == {"total": 0, "completed": 0, "percentage": 0}
+    assert summary["recent_events"] == []
+    assert summary["metrics"] == {}
+
+
+def test_event_log_write_errors_are_reported(tmp_path, capsys):
+    """Test that a failing event log does not stop the writer or hang flush."""
+    log_dir = tmp_path / "logs"
+    tracker = FeedbackTracker(config={"log_dir": str(log_dir), "enable_console": False})
     tracker.initialize()
+    shutil.rmtree(log_dir)
     
-    events_received = []
+    tracker.log_event("Lost")
+    tracker.flush()
+    assert "failed to write 1 event(s)" in capsys.readouterr().err
     
-    def listener(event):
-        events_received.append(event)
+    log_dir.mkdir()
+    tracker.log_event("Kept")
+    export = tracker.export_events(tmp_path / "events.jsonl")
+    tracker.cleanup()
     
-    tracker.add_listener(listener)
-    tracker.log_event("Test event", level="info")
+    assert [json.loads(line)["message"] for line in export.read_text().splitlines()] == ["Kept"]
+    assert [event["message"] for event in tracker.events] == ["Lost", "Kept"]
+
+
+def test_background_listener_errors_are_reported(tmp_path, capsys):
+    """Test that exceptions from background listeners are not lost."""
+    tracker = FeedbackTracker(config={
+        "log_dir": str(tmp_path / "logs"),
+        "enable_console": False
+    })
+    received = []
     
-    assert len(events_received) == 1
-    assert events_received[0]["message"] == "Test event"
+    def broken(event):
+        raise RuntimeError("listener broke")
+    
+    tracker.add_listener(broken, background=True)
+    tracker.add_listener(lambda event: received.append(event["message"]), background=True)
+    tracker.log_event("First")
+    tracker.log_event("Second")
+    tracker.cleanup()
+    
+    err = capsys.readouterr().err
+    assert err.count("background listener") == 2
+    assert "broken failed: RuntimeError('listener broke')" in err
+    assert received == ["First", "Second"]
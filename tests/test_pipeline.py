@@ -1,4 +1,6 @@
 """Tests for pipeline manager."""
+import asyncio
+import threading
 import pytest
 from aidevelopertool.pipeline.manager import (
     PipelineManager,
@@ -208,3 +210,264 @@ def test_pipeline_manager_status():
     assert status["initialized"]
     assert status["pipelines_count"] == 1
     assert "test" in status["pipelines"]
+
+
+def test_pipeline_independent_tasks_run_concurrently():
+    """Test that independent tasks overlap during execution."""
+    pipeline = Pipeline("test")
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def branch(context):
+        barrier.wait()
+        return "done"
+    
+    pipeline.add_task(Task("root", lambda ctx: None))
+    pipeline.add_task(Task("left", branch, dependencies=["root"]))
+    pipeline.add_task(Task("right", branch, dependencies=["root"]))
+    pipeline.add_task(Task("join", lambda ctx: None, dependencies=["left", "right"]))
+    
+    result = pipeline.execute(max_workers=2)
+    
+    assert result["success"]
+    assert result["execution_order"][0] == "root"
+    assert result["execution_order"][-1] == "join"
+
+
+def test_pipeline_finalize_plan():
+    """Test compiling the execution plan into dependency waves."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("train", lambda ctx: None))
+    pipeline.add_task(Task("validate", lambda ctx: None, dependencies=["train"]))
+    pipeline.add_task(Task("test", lambda ctx: None, dependencies=["train"]))
+    pipeline.add_task(Task("report", lambda ctx: None, dependencies=["validate", "test"]))
+    
+    plan = pipeline.finalize()
+    assert plan == [["train"], ["validate", "test"], ["report"]]
+    assert pipeline.finalize() is plan
+    
+    pipeline.remove_task("report")
+    assert pipeline.finalize() == [["train"], ["validate", "test"]]
+
+
+def test_pipeline_repeated_execution():
+    """Test executing the same pipeline more than once."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("task1", lambda ctx: "task1_done"))
+    pipeline.add_task(Task("task2", lambda ctx: "task2_done", dependencies=["task1"]))
+    
+    first = pipeline.execute()
+    second = pipeline.execute()
+    
+    assert first["success"] and second["success"]
+    assert second["execution_order"] == ["task1", "task2"]
+    assert pipeline.tasks["task2"].status == TaskStatus.COMPLETED
+
+
+def test_pipeline_async_execution():
+    """Test executing coroutine tasks concurrently on one event loop."""
+    pipeline = Pipeline("test")
+    started = []
+    
+    async def branch(context):
+        started.append(len(started))
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        return "done"
+    
+    async def report(context):
+        context["report"] = True
+    
+    pipeline.add_task(Task("train", lambda ctx: ctx.update(model=True)))
+    pipeline.add_task(Task("validate", branch, dependencies=["train"]))
+    pipeline.add_task(Task("test", branch, dependencies=["train"]))
+    pipeline.add_task(Task("report", report, dependencies=["validate", "test"]))
+    
+    result = pipeline.execute()
+    
+    assert result["success"]
+    assert result["execution_order"][-1] == "report"
+    assert result["context"]["model"] and result["context"]["report"]
+    
+    result = asyncio.run(pipeline.execute_async())
+    assert len(result["completed_tasks"]) == 4
+
+
+def test_pipeline_failure_skips_dependents():
+    """Test that all tasks downstream of a failure are skipped."""
+    pipeline = Pipeline("test")
+    
+    def failing_task(context):
+        raise ValueError("Task failed")
+    
+    pipeline.add_task(Task("failing", failing_task))
+    pipeline.add_task(Task("child", lambda ctx: 1, dependencies=["failing"]))
+    pipeline.add_task(Task("grandchild", lambda ctx: 2, dependencies=["child"]))
+    pipeline.add_task(Task("independent", lambda ctx: 3))
+    
+    result = pipeline.execute()
+    
+    assert result["failed_tasks"] == ["failing"]
+    assert result["completed_tasks"] == ["independent"]
+    assert pipeline.tasks["child"].status == TaskStatus.SKIPPED
+    assert pipeline.tasks["grandchild"].status == TaskStatus.SKIPPED
+    assert Task("t", lambda ctx: 0, dependencies=["a"]).can_run({"a"})
+
+
+def test_pipeline_circular_dependency():
+    """Test that tasks in or leading to a cycle are reported."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("a", lambda ctx: None, dependencies=["b"]))
+    pipeline.add_task(Task("b", lambda ctx: None, dependencies=["a"]))
+    pipeline.add_task(Task("c", lambda ctx: None, dependencies=["a"]))
+    pipeline.add_task(Task("d", lambda ctx: None))
+    pipeline.add_task(Task("e", lambda ctx: None, dependencies=["d", "missing"]))
+    
+    errors = pipeline.validate()
+    
+    assert errors == [
+        "Circular dependency detected for task: a",
+        "Circular dependency detected for task: b",
+        "Circular dependency detected for task: c",
+        "Task 'e' depends on missing task 'missing'",
+    ]
+    assert not pipeline.execute()["success"]
+
+
+def test_pipeline_missing_dependencies_in_task_order():
+    """Test that missing dependencies are reported in task declaration order."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("a", lambda ctx: None, dependencies=["b", "gone_a"]))
+    pipeline.add_task(Task("b", lambda ctx: None, dependencies=["c", "gone_b"]))
+    pipeline.add_task(Task("c", lambda ctx: None, dependencies=["gone_c1", "gone_c2"]))
+    
+    assert pipeline.validate() == [
+        "Task 'a' depends on missing task 'gone_a'",
+        "Task 'b' depends on missing task 'gone_b'",
+        "Task 'c' depends on missing task 'gone_c1'",
+        "Task 'c' depends on missing task 'gone_c2'",
+    ]
+
+
+def test_pipeline_validation_wide_diamonds():
+    """Test validation of a deep chain of diamond-shaped dependencies."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("t0", lambda ctx: None))
+    for i in range(1, 60):
+        pipeline.add_task(Task(f"l{i}", lambda ctx: None, dependencies=[f"t{i - 1}"]))
+        pipeline.add_task(Task(f"r{i}", lambda ctx: None, dependencies=[f"t{i - 1}"]))
+        pipeline.add_task(Task(f"t{i}", lambda ctx: None, dependencies=[f"l{i}", f"r{i}"]))
+    
+    assert pipeline.validate() == []
+
+
+def test_pipeline_manager_execute_async():
+    """Test executing a managed pipeline from a running event loop."""
+    manager = PipelineManager()
+    pipeline = manager.create_pipeline("test")
+    
+    async def fetch(context):
+        await asyncio.sleep(0)
+        return "data"
+    
+    pipeline.add_task(Task("fetch", fetch))
+    pipeline.add_task(Task("process", lambda ctx: None, dependencies=["fetch"]))
+    
+    result = asyncio.run(manager.execute_pipeline_async("test"))
+    assert result["completed_tasks"] == ["fetch", "process"]
+    
+    result = asyncio.run(manager.execute_pipeline_async("missing"))
+    assert not result["success"]
+
+
+def test_pipeline_single_worker_runs_inline():
+    """Test that a single-worker run executes tasks on the calling thread."""
+    pipeline = Pipeline("test")
+    threads = []
+    
+    def record(context):
+        threads.append(threading.current_thread())
+    
+    pipeline.add_task(Task("a", record))
+    pipeline.add_task(Task("b", record, dependencies=["a"]))
+    pipeline.add_task(Task("c", record, dependencies=["a"]))
+    pipeline.add_task(Task("d", record, dependencies=["b", "c"]))
+    
+    result = pipeline.execute(max_workers=1)
+    
+    assert result["success"]
+    assert result["execution_order"][0] == "a"
+    assert result["execution_order"][-1] == "d"
+    assert threads == [threading.current_thread()] * 4
+
+
+def test_pipeline_propagates_base_exceptions():
+    """Test that a task raising SystemExit stops the run and propagates."""
+    pipeline = Pipeline("test")
+    
+    def exiting_task(context):
+        raise SystemExit(3)
+    
+    pipeline.add_task(Task("exit", exiting_task))
+    pipeline.add_task(Task("child", lambda ctx: 1, dependencies=["exit"]))
+    pipeline.add_task(Task("other", lambda ctx: 2))
+    
+    with pytest.raises(SystemExit):
+        pipeline.execute(max_workers=2)
+    assert pipeline.tasks["child"].status == TaskStatus.PENDING
+
+
+def test_pipeline_caches_validation(monkeypatch):
+    """Test that validation reruns only after the task set changes."""
+    pipeline = Pipeline("test")
+    pipeline.add_task(Task("task1", lambda ctx: 1))
+    pipeline.add_task(Task("task2", lambda ctx: 2, dependencies=["missing"]))
+    
+    calls = []
+    validate = Pipeline.validate
+    monkeypatch.setattr(Pipeline, "validate", lambda self: calls.append(1) or validate(self))
+    
+    first = pipeline.execute()
+    second = pipeline.execute()
+    assert not first["success"] and not second["success"]
+    assert second["errors"] == ["Task 'task2' depends on missing task 'missing'"]
+    assert len(calls) == 1
+    
+    pipeline.add_task(Task("missing", lambda ctx: 0))
+    assert pipeline.execute()["success"]
+    assert pipeline.execute()["success"]
+    assert len(calls) == 2
+
+
+def test_pipeline_async_cancellation_stops_running_tasks():
+    """Test that cancelling an async run cancels its in-flight tasks."""
+    pipeline = Pipeline("test")
+    started = []
+    cancelled = []
+    
+    async def slow(context):
+        started.append(True)
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+    
+    async def after(context):
+        context["after"] = True
+    
+    pipeline.add_task(Task("slow1", slow))
+    pipeline.add_task(Task("slow2", slow))
+    pipeline.add_task(Task("after", after, dependencies=["slow1"]))
+    
+    async def run():
+        run_task = asyncio.ensure_future(pipeline.execute_async())
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        run_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+        assert len(asyncio.all_tasks()) == 1
+    
+    asyncio.run(run())
+    assert cancelled == [True, True]
+    assert "after" not in pipeline.context